@@ -0,0 +1,238 @@
+"""Benchmark do caminho de desenho em um contexto OpenGL sem janela.
+
+Exemplo (a partir da raiz do repositório)::
+
+    python benchmark_draw.py --rows 40 --cols 40 --frames 300 --dump-frames out/
+
+Por padrão usa o modo headless do Arcade (EGL) com renderização por software
+(Mesa llvmpipe), de modo que roda em máquinas sem GPU e sem display.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from game.frame_governor import QUALITY_LEVELS
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5)
+    parser.add_argument("--cols", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument(
+        "--fill", type=float, default=0.8, help="fração das células com cultura"
+    )
+    parser.add_argument(
+        "--dead", type=float, default=0.1, help="fração das células com solo morto"
+    )
+    parser.add_argument("--plagues", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--simulate",
+        action="store_true",
+        help="avança a simulação a cada quadro, em vez de desenhar um estado fixo",
+    )
+    parser.add_argument(
+        "--dump-frames",
+        metavar="DIR",
+        help="salva quadros PNG para comparação visual",
+    )
+    parser.add_argument("--dump-every", type=int, default=100)
+    parser.add_argument(
+        "--hardware",
+        action="store_true",
+        help="não força a renderização por software",
+    )
+    parser.add_argument(
+        "--window", action="store_true", help="usa uma janela visível em vez de EGL"
+    )
+    parser.add_argument(
+        "--quality",
+        choices=[level.name for level in QUALITY_LEVELS] + ["adaptive"],
+        default=QUALITY_LEVELS[0].name,
+        help="nível de qualidade fixo, ou 'adaptive' para usar o FrameGovernor",
+    )
+    return parser.parse_args(argv)
+
+
+def populate_board(simulation, fill, dead, plague_count, seed):
+    """Preenche o tabuleiro com culturas, solo morto e pragas de forma determinística."""
+    from game.model import CropFactory, GrowthStage, Plague
+
+    rng = random.Random(seed)
+    crop_types = list(CropFactory._crop_configs)
+    grid = simulation.grid
+    plague_manager = simulation.plague_manager
+
+    for row in grid.cells:
+        for cell in row:
+            roll = rng.random()
+            if roll < dead:
+                cell.soil.kill()
+            elif roll < dead + fill:
+                crop = CropFactory.create_crop(
+                    rng.choice(crop_types), cell.x, cell.y, simulation.total_time
+                )
+                crop.growth_stage = GrowthStage(rng.randrange(len(GrowthStage)))
+                crop.hp = rng.randint(1, 100)
+                grid.add_crop(cell, crop)
+
+    vulnerable = [
+        cell
+        for row in grid.cells
+        for cell in row
+        if cell.crop and cell.crop.type in plague_manager.vulnerable_crop_types
+    ]
+    for cell in rng.sample(vulnerable, min(plague_count, len(vulnerable))):
+        plague = Plague(cell.x, cell.y, plague_manager)
+        plague_manager._claim_target(plague, cell.crop)
+        plague_manager.plagues.add(plague)
+
+
+def summarize(name, frame_times):
+    frame_times = sorted(frame_times)
+    count = len(frame_times)
+
+    def percentile(fraction):
+        return frame_times[min(count - 1, int(fraction * count))]
+
+    mean = statistics.fmean(frame_times)
+    return (
+        f"{name:<28} n={count:<5} mean={mean * 1000:7.3f}ms "
+        f"min={frame_times[0] * 1000:7.3f} p50={percentile(0.5) * 1000:7.3f} "
+        f"p95={percentile(0.95) * 1000:7.3f} p99={percentile(0.99) * 1000:7.3f} "
+        f"max={frame_times[-1] * 1000:7.3f} fps~{1 / mean:7.1f}"
+    )
+
+
+def run_scenario(name, window, draw, step, args, on_frame=None):
+    import arcade
+
+    frame_times = []
+    for frame in range(args.warmup + args.frames):
+        step()
+
+        start = time.perf_counter()
+        draw()
+        # Espera a GPU (ou o llvmpipe) terminar para medir o quadro inteiro
+        window.ctx.finish()
+        elapsed = time.perf_counter() - start
+        if on_frame is not None:
+            on_frame(elapsed)
+
+        if frame < args.warmup:
+            continue
+        frame_times.append(elapsed)
+
+        index = frame - args.warmup
+        if args.dump_frames and index % args.dump_every == 0:
+            arcade.get_image().save(
+                os.path.join(args.dump_frames, f"{name}_{index:05d}.png")
+            )
+
+    return frame_times
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Precisa ser definido antes de importar o Arcade
+    if not args.window:
+        os.environ.setdefault("ARCADE_HEADLESS", "1")
+    if not args.hardware:
+        os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
+
+    import arcade
+    from game.configs import Configs
+    from game.simulation import Simulation
+
+    if args.dump_frames:
+        os.makedirs(args.dump_frames, exist_ok=True)
+
+    window = arcade.Window(
+        Configs.SCREEN_WIDTH,
+        Configs.SCREEN_HEIGHT,
+        Configs.SCREEN_TITLE,
+        visible=args.window,
+    )
+    print(f"Renderer: {window.ctx.info.RENDERER}")
+
+    random.seed(args.seed)
+    simulation = Simulation(args.rows, args.cols)
+    populate_board(simulation, args.fill, args.dead, args.plagues, args.seed)
+
+    from game.board_renderer import BoardRenderer
+    from game.forecast import ForecastModel
+    from game.frame_governor import FrameGovernor
+
+    # Sem o modo adaptativo o nível fica fixo: cada cenário mede a mesma
+    # qualidade do início ao fim, sem herdar o nível do cenário anterior
+    adaptive = args.quality == "adaptive"
+    level = 0
+    if not adaptive:
+        level = [quality.name for quality in QUALITY_LEVELS].index(args.quality)
+
+    snapshots = [simulation.snapshot()] * 2  # anterior e atual
+
+    def step():
+        # O snapshot é trabalho do modelo: fica fora do trecho medido
+        if args.simulate:
+            simulation.step(1 / 60)
+            snapshots[:] = snapshots[1], simulation.snapshot()
+
+    # Previsão calculada uma vez, só para desenhar a camada correspondente
+    forecast = ForecastModel(
+        simulation.grid.neighbour_indices, runs=16, seed=args.seed
+    ).forecast(snapshots[1])
+
+    # Mesmo caminho de GameView.on_draw_before_ui, sem o arcade.gui
+    scenarios = [
+        ("sprites", {}),
+        ("indicators", {"show_indicators": True}),
+        (
+            "all-layers",
+            {
+                "show_indicators": True,
+                "show_risk_overlay": True,
+                "forecast": forecast,
+            },
+        ),
+    ]
+
+    results = []
+    for name, layers in scenarios:
+        renderer = BoardRenderer()
+        governor = FrameGovernor(adaptive=adaptive, level=level)
+
+        def draw():
+            previous, snapshot = snapshots
+            window.clear()
+            renderer.draw(snapshot, previous, 1.0, governor, **layers)
+
+        frame_times = run_scenario(
+            name, window, draw, step, args, on_frame=governor.record
+        )
+        quality = governor.quality.name
+        if adaptive:
+            quality = f"adaptive, ended at {quality}"
+        results.append(
+            f"{summarize(f'BoardRenderer ({name})', frame_times)} quality={quality}"
+        )
+
+    print(
+        f"Board {args.rows}x{args.cols}, {len(simulation.grid.crops)} crops, "
+        f"{len(simulation.plague_manager.plagues)} plagues"
+    )
+    for line in results:
+        print(line)
+
+    window.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
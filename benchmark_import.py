@@ -0,0 +1,79 @@
+"""Mede o tempo de importação das camadas do jogo que não usam janela.
+
+Exemplo (a partir da raiz do repositório)::
+
+    python benchmark_import.py --repeat 5
+
+Cada módulo é importado em um interpretador novo com ``-X importtime``; o
+script falha se algum deles carregar o Arcade ou o pyglet.
+"""
+
+import argparse
+import os
+import pkgutil
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos que desenham ou abrem a janela; todos os outros não podem usar o Arcade
+RENDERING_MODULES = {"my_game", "scene_manager", "sprites", "board_renderer"}
+
+RENDERING_PACKAGES = ("arcade", "pyglet")
+
+
+def window_free_modules():
+    """Módulos do pacote ``game`` que não são telas nem parte da renderização."""
+    return [
+        f"game.{module.name}"
+        for module in pkgutil.iter_modules([os.path.join(ROOT, "game")])
+        if module.name not in RENDERING_MODULES and not module.name.endswith("_view")
+    ]
+
+
+def measure(module):
+    """Importa ``module`` em um processo novo; devolve (microssegundos, pacotes)."""
+    check = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {RENDERING_PACKAGES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+
+    # Cada linha: "import time: self [us] | cumulative | imported package"
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            total = int(cumulative)
+
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return total, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in window_free_modules():
+        runs = [measure(module) for _ in range(args.repeat)]
+        best = min(total for total, _ in runs)
+        loaded = runs[0][1]
+        status = "ok" if not loaded else "loads " + ", ".join(loaded)
+        failed = failed or bool(loaded)
+        print(f"{module:<24} {best / 1000:8.1f} ms  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
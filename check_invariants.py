@@ -0,0 +1,206 @@
+"""Confere as estruturas incrementais do modelo contra recálculos completos.
+
+Exemplo (a partir da raiz do repositório)::
+
+    python check_invariants.py --steps 5000 --seeds 3
+
+Joga partidas aleatórias (plantio, colheita, pesticida, pragas consumindo e
+buscando culturas, troca do tipo vulnerável) em todas as topologias, com e
+sem bordas contínuas, e a cada passo verifica:
+
+- ``DistanceField``: distâncias iguais a uma busca em largura completa a
+  partir das culturas vulneráveis sem praga;
+- ``RiskClusters``: tamanho da mancha de cada célula igual ao componente
+  conexo calculado do zero;
+- no máximo uma praga por célula, como exigem os sprites de ``SpriteManager``.
+
+Cada partida para na primeira divergência, e o script sai com código 1 se
+alguma divergir.
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+from collections import deque
+from game.configs import Configs
+from game.distance_field import UNREACHABLE
+from game.model import CropFactory, PlayerAction
+from game.simulation import AreaCommand, CellCommand, Simulation
+
+GRIDS = [
+    ("square4", False),
+    ("square4", True),
+    ("square8", False),
+    ("square8", True),
+    ("hex", False),
+    ("hex", True),
+]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=8, help="par, por causa do hex")
+    parser.add_argument("--cols", type=int, default=7)
+    parser.add_argument("--steps", type=int, default=3000)
+    parser.add_argument("--seeds", type=int, default=2)
+    return parser.parse_args(argv)
+
+
+def is_vulnerable(cell, vulnerable_crop_types):
+    crop = cell.crop
+    return crop is not None and crop.type in vulnerable_crop_types and crop.hp > 0
+
+
+def expected_distances(simulation):
+    """Busca em largura a partir das culturas vulneráveis sem praga."""
+    grid = simulation.grid
+    plague_manager = simulation.plague_manager
+    targeted = {plague.target_crop for plague in plague_manager.plagues}
+
+    distance = [UNREACHABLE] * (grid.num_rows * grid.num_cols)
+    queue = deque()
+    for row in grid.cells:
+        for cell in row:
+            if (
+                is_vulnerable(cell, plague_manager.vulnerable_crop_types)
+                and cell.crop not in targeted
+            ):
+                index = cell.row * grid.num_cols + cell.col
+                distance[index] = 0
+                queue.append(index)
+
+    while queue:
+        index = queue.popleft()
+        for neighbour in grid.neighbour_indices[index]:
+            if distance[neighbour] > distance[index] + 1:
+                distance[neighbour] = distance[index] + 1
+                queue.append(neighbour)
+    return distance
+
+
+def expected_cluster_sizes(simulation):
+    """Tamanho do componente conexo de culturas vulneráveis de cada célula."""
+    grid = simulation.grid
+    vulnerable_crop_types = simulation.plague_manager.vulnerable_crop_types
+    cells = [cell for row in grid.cells for cell in row]
+    at_risk = [is_vulnerable(cell, vulnerable_crop_types) for cell in cells]
+
+    sizes = [0] * len(cells)
+    for start in range(len(cells)):
+        if not at_risk[start] or sizes[start]:
+            continue
+        component = [start]
+        seen = {start}
+        for index in component:
+            for neighbour in grid.neighbour_indices[index]:
+                if at_risk[neighbour] and neighbour not in seen:
+                    seen.add(neighbour)
+                    component.append(neighbour)
+        for index in component:
+            sizes[index] = len(component)
+    return sizes
+
+
+def random_action(simulation, rng):
+    grid = simulation.grid
+    player = simulation.player
+    row, col = rng.randrange(grid.num_rows), rng.randrange(grid.num_cols)
+    roll = rng.random()
+
+    if roll < 0.15:
+        player.select_action(PlayerAction.PLANT)
+        player.select_crop(rng.choice(list(CropFactory._crop_configs)))
+        simulation.apply(CellCommand(row, col))
+    elif roll < 0.18:
+        player.select_action(PlayerAction.PLANT)
+        player.select_crop(rng.choice(list(CropFactory._crop_configs)))
+        simulation.apply(
+            AreaCommand(
+                row, col, rng.randrange(grid.num_rows), rng.randrange(grid.num_cols)
+            )
+        )
+    elif roll < 0.20:
+        player.select_action(PlayerAction.HARVEST)
+        simulation.apply(AreaCommand(0, 0, grid.num_rows - 1, grid.num_cols - 1))
+    elif roll < 0.22:
+        player.select_action(PlayerAction.APPLY_PESTICIDE)
+        simulation.apply(CellCommand(row, col))
+    elif roll < 0.225:
+        crop_types = list(CropFactory._crop_configs)
+        simulation.plague_manager.set_vulnerable_types(
+            rng.sample(crop_types, rng.randint(1, len(crop_types)))
+        )
+    elif roll < 0.25:
+        # Recupera solo consumido para o tabuleiro não se esgotar
+        grid.get_cell(row, col).soil.set_alive()
+
+
+def check_game(topology, wrap, seed, args) -> int:
+    random.seed(seed)
+    rng = random.Random(seed)
+    # O modelo imprime cada evento; em milhares de passos isso só atrapalha
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = Simulation(args.rows, args.cols, topology=topology, wrap=wrap)
+        simulation.player.money = 10**9
+
+        for step in range(args.steps):
+            random_action(simulation, rng)
+            simulation.step(1 / Configs.SIMULATION_RATE)
+
+            failures = []
+            grid = simulation.grid
+            if grid.distance_field.distance != expected_distances(simulation):
+                failures.append("distance field")
+
+            sizes = [
+                grid.risk_clusters.cluster_size(cell.row, cell.col)
+                for row in grid.cells
+                for cell in row
+            ]
+            if sizes != expected_cluster_sizes(simulation):
+                failures.append("risk clusters")
+
+            plague_cells = [
+                plague.cell_index for plague in simulation.snapshot().plagues
+            ]
+            if len(plague_cells) != len(set(plague_cells)):
+                failures.append("two plagues in one cell")
+
+            if failures:
+                simulation.close()
+                break
+        else:
+            simulation.close()
+            return 0
+
+    print(
+        f"{topology} wrap={wrap} seed={seed}: {', '.join(failures)} "
+        f"diverged at step {step}"
+    )
+    return 1
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    search = Configs.PLAGUE_SEARCH
+
+    failed = 0
+    try:
+        # Com e sem busca: pragas em busca também reclamam alvos e ocupam células
+        for plague_search in (False, True):
+            Configs.PLAGUE_SEARCH = plague_search
+            for topology, wrap in GRIDS:
+                for seed in range(args.seeds):
+                    failed += check_game(topology, wrap, seed, args)
+    finally:
+        Configs.PLAGUE_SEARCH = search
+
+    games = 2 * len(GRIDS) * args.seeds
+    print(f"{games - failed}/{games} games consistent over {args.steps} steps each")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
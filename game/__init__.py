@@ -1 +1,11 @@
-from .my_game import MyGame
+# O modelo, a simulação e as ferramentas não dependem do Arcade. A janela
+# (e com ela pyglet e arcade.gui) só é importada quando MyGame é usado.
+__all__ = ["MyGame"]
+
+
+def __getattr__(name):
+    if name == "MyGame":
+        from .my_game import MyGame
+
+        return MyGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,306 @@
+import os
+import struct
+import sys
+import time
+from array import array
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional, Tuple
+from .model import CropFactory
+
+MAGIC = b"FVPB"
+VERSION = 2
+
+# Cabeçalho: identificação, dimensões, contador de sequência, contadores e o
+# processo que escreve no bloco
+HEADER = struct.Struct("<4sIIIQqdqiiiiiiq")
+SEQUENCE = struct.Struct("<Q")
+SEQUENCE_OFFSET = 16
+STATS = struct.Struct("<qdqiiiiii")
+STATS_OFFSET = SEQUENCE_OFFSET + SEQUENCE.size
+
+# Colunas por célula, em ordem row-major: nome -> typecode do módulo array
+COLUMNS = {
+    "soil_alive": "B",
+    "crop_type": "b",  # índice em CropFactory._crop_configs, -1 se vazia
+    "growth_stage": "b",  # -1 se vazia
+    "plague": "B",  # 1 se há praga na célula
+    "hp": "f",
+}
+
+
+def column_offsets(num_cells) -> dict:
+    offsets = {}
+    offset = HEADER.size
+    for name, typecode in COLUMNS.items():
+        itemsize = array(typecode).itemsize
+        offset += -offset % itemsize  # alinhamento
+        offsets[name] = offset
+        offset += itemsize * num_cells
+    offsets["size"] = offset
+    return offsets
+
+
+def _untrack(shm):
+    # Só quem criou o bloco deve removê-lo ao terminar (bpo-39959)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+
+def _is_running(pid) -> bool:
+    if os.name != "posix":
+        # Fora do POSIX o bloco some com o último processo que o abriu
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _writer_pid(buf) -> Optional[int]:
+    """Processo que escreve num bloco desta versão (None se não for um)."""
+    if len(buf) < HEADER.size:
+        return None
+    header = HEADER.unpack_from(buf)
+    if header[0] != MAGIC or header[1] != VERSION:
+        return None
+    return header[-1]
+
+
+class ExportedBoard(NamedTuple):
+    sequence: int
+    num_rows: int
+    num_cols: int
+    tick: int
+    time: float
+    money: int
+    active_plagues: int
+    max_plagues: int
+    crops_harvested: int
+    plagues_eliminated: int
+    crops_consumed: int
+    game_over: bool
+    soil_alive: array
+    crop_type: array
+    growth_stage: array
+    plague: array
+    hp: array
+
+
+class BoardExporter:
+    """Publica o estado do tabuleiro num bloco de memória compartilhada.
+
+    A escrita segue um seqlock: o contador de sequência fica ímpar enquanto
+    o bloco é atualizado e volta a ser par no fim. Leitores em outros
+    processos (``BoardReader``) copiam o bloco e só aceitam a cópia se o
+    contador era par e não mudou durante a leitura; o jogo nunca espera por
+    eles.
+    """
+
+    def __init__(self, name, num_rows, num_cols):
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.offsets = column_offsets(num_rows * num_cols)
+        self.sequence = 0
+        self.crop_indices = {
+            crop_type: i for i, crop_type in enumerate(CropFactory._crop_configs)
+        }
+
+        try:
+            self.shm = shared_memory.SharedMemory(
+                name, create=True, size=self.offsets["size"]
+            )
+        except FileExistsError:
+            self._remove_stale_block(name)
+            self.shm = shared_memory.SharedMemory(
+                name, create=True, size=self.offsets["size"]
+            )
+
+        HEADER.pack_into(
+            self.shm.buf,
+            0,
+            MAGIC,
+            VERSION,
+            num_rows,
+            num_cols,
+            0,
+            *[0] * 9,
+            os.getpid(),
+        )
+        self._columns = {
+            name: array(typecode, bytes(array(typecode).itemsize * num_rows * num_cols))
+            for name, typecode in COLUMNS.items()
+        }
+
+    @staticmethod
+    def _remove_stale_block(name):
+        """Remove um bloco deixado por uma partida que terminou sem fechá-lo.
+
+        Blocos de outro formato ou cujo processo ainda roda nunca são
+        removidos: nesse caso é levantado ``FileExistsError``.
+        """
+        existing = shared_memory.SharedMemory(name)
+        try:
+            writer = _writer_pid(existing.buf)
+            stale = writer is not None and not _is_running(writer)
+            if stale:
+                existing.unlink()
+            else:
+                _untrack(existing)
+        finally:
+            existing.close()
+
+        if writer is None:
+            raise FileExistsError(
+                f"Shared memory block {name!r} exists and is not a board export"
+            )
+        if not stale:
+            raise FileExistsError(
+                f"Board export {name!r} is in use by process {writer}; "
+                "choose another BOARD_EXPORT_NAME"
+            )
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def publish(self, snapshot):
+        num_cells = self.num_rows * self.num_cols
+        if len(snapshot.cells) != num_cells:
+            raise ValueError("Snapshot does not match the exported board size")
+
+        # Monta as colunas fora da seção crítica, em buffers reutilizados
+        columns = self._columns
+        soil_alive = columns["soil_alive"]
+        crop_type = columns["crop_type"]
+        growth_stage = columns["growth_stage"]
+        plague = columns["plague"]
+        hp = columns["hp"]
+        crop_indices = self.crop_indices
+        for index, cell in enumerate(snapshot.cells):
+            soil_alive[index] = cell.soil_alive
+            plague[index] = 0
+            hp[index] = cell.hp
+            if cell.crop_type is None:
+                crop_type[index] = -1
+                growth_stage[index] = -1
+            else:
+                crop_type[index] = crop_indices[cell.crop_type]
+                growth_stage[index] = cell.growth_stage.value
+        for snapshot_plague in snapshot.plagues:
+            plague[snapshot_plague.cell_index] = 1
+
+        buf = self.shm.buf
+        self.sequence += 1
+        SEQUENCE.pack_into(buf, SEQUENCE_OFFSET, self.sequence)
+        STATS.pack_into(
+            buf,
+            STATS_OFFSET,
+            snapshot.tick,
+            snapshot.time,
+            snapshot.money,
+            snapshot.active_plagues,
+            snapshot.max_plagues,
+            snapshot.crops_harvested,
+            snapshot.plagues_eliminated,
+            snapshot.crops_consumed,
+            snapshot.game_over,
+        )
+        for name, column in columns.items():
+            data = memoryview(column).cast("B")
+            offset = self.offsets[name]
+            buf[offset : offset + len(data)] = data
+        self.sequence += 1
+        SEQUENCE.pack_into(buf, SEQUENCE_OFFSET, self.sequence)
+
+    def close(self):
+        if self.shm is None:
+            return
+
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+
+class BoardReader:
+    """Acesso de outro processo ao bloco publicado por ``BoardExporter``.
+
+    ``columns`` expõe as colunas sem cópia, direto na memória compartilhada
+    (os valores podem mudar a qualquer momento); ``read`` devolve uma cópia
+    consistente de um único tick.
+    """
+
+    def __init__(self, name):
+        if sys.version_info >= (3, 13):
+            self.shm = shared_memory.SharedMemory(name, track=False)
+        else:
+            self.shm = shared_memory.SharedMemory(name)
+            _untrack(self.shm)
+
+        self.writer_pid = _writer_pid(self.shm.buf)
+        if self.writer_pid is None:
+            self.shm.close()
+            raise ValueError(f"{name!r} is not a board export (version {VERSION})")
+        self.num_rows, self.num_cols = HEADER.unpack_from(self.shm.buf)[2:4]
+
+        num_cells = self.num_rows * self.num_cols
+        offsets = column_offsets(num_cells)
+        self.columns = {
+            name: self.shm.buf[
+                offsets[name] : offsets[name] + array(typecode).itemsize * num_cells
+            ].cast(typecode)
+            for name, typecode in COLUMNS.items()
+        }
+
+    @property
+    def sequence(self) -> int:
+        return SEQUENCE.unpack_from(self.shm.buf, SEQUENCE_OFFSET)[0]
+
+    def read(self, max_attempts=1000) -> Optional[ExportedBoard]:
+        """Cópia consistente do último tick publicado (None se nunca houve)."""
+        buf = self.shm.buf
+        for _ in range(max_attempts):
+            before = self.sequence
+            if before % 2:
+                time.sleep(0)  # escrita em andamento
+                continue
+
+            stats = STATS.unpack_from(buf, STATS_OFFSET)
+            columns = {
+                name: array(COLUMNS[name], column.tobytes())
+                for name, column in self.columns.items()
+            }
+            if self.sequence == before:
+                if before == 0:
+                    return None
+                return ExportedBoard(
+                    before,
+                    self.num_rows,
+                    self.num_cols,
+                    *stats[:-1],
+                    bool(stats[-1]),
+                    **columns,
+                )
+        raise RuntimeError("Board export kept changing while being read")
+
+    @property
+    def crop_types(self) -> Tuple[str, ...]:
+        return tuple(CropFactory._crop_configs)
+
+    def close(self):
+        if self.shm is None:
+            return
+
+        for column in self.columns.values():
+            column.release()
+        self.columns = {}
+        self.shm.close()
+        self.shm = None
+
+
+def attach_board(name) -> BoardReader:
+    return BoardReader(name)
@@ -0,0 +1,276 @@
+import arcade
+from arcade.shape_list import ShapeElementList, create_line, create_rectangle_filled
+from pyglet.graphics import Batch
+from .configs import Configs
+from .model import GrowthStage, PlagueState
+from .sprites import SpriteManager, lerp
+
+
+class BoardRenderer:
+    """Desenha o tabuleiro de um ``BoardSnapshot``: sprites, indicadores e camadas.
+
+    Não depende do ``arcade.gui``, então também roda em contextos sem janela
+    (por exemplo, no benchmark de desenho). O que é atualizado a cada quadro
+    segue o nível de qualidade do ``FrameGovernor`` recebido em ``draw``.
+    """
+
+    def __init__(self):
+        self.sprite_manager = SpriteManager()
+        self.indicator_shapes = None
+
+        # Camadas de risco e previsão em cache: cada uma guarda o estado a
+        # partir do qual foi construída e só é refeita quando ele muda
+        self.risk_key = None
+        self.risk_shapes = None
+        self.forecast_key = None
+        self.forecast_shapes = None
+        self.forecast_text = None
+        self.forecast_labels = []
+
+    def reset(self):
+        """Descarta os indicadores e as camadas em cache (por exemplo, nova partida)."""
+        self.indicator_shapes = None
+        self.risk_key = None
+        self.risk_shapes = None
+        self.forecast_key = None
+        self.forecast_shapes = None
+        self.forecast_text = None
+        self.forecast_labels = []
+
+    def clear(self):
+        self.sprite_manager.clear()
+        self.reset()
+
+    def draw(
+        self,
+        snapshot,
+        previous,
+        alpha,
+        governor,
+        show_indicators=False,
+        show_risk_overlay=False,
+        forecast=None,
+        selection=None,
+    ):
+        quality = governor.quality
+
+        self.sprite_manager.sync(
+            snapshot,
+            previous,
+            alpha,
+            update_crops=governor.is_due(quality.crop_interval),
+        )
+        self.sprite_manager.draw()
+
+        if show_risk_overlay:
+            self._draw_risk_overlay(snapshot, governor)
+
+        if forecast is not None:
+            self._draw_forecast_overlay(snapshot, forecast, governor)
+
+        if selection is not None:
+            self._draw_selection(snapshot, selection)
+
+        if show_indicators:
+            self._draw_indicators(snapshot, previous, alpha, governor)
+
+    def _draw_indicators(self, snapshot, previous, alpha, governor):
+        # Barras e linhas são desenhadas em um único lote, reconstruído apenas
+        # nos quadros permitidos pelo nível de qualidade
+        quality = governor.quality
+        if self.indicator_shapes is None or governor.is_due(quality.indicator_interval):
+            self.indicator_shapes = self._build_indicator_shapes(
+                snapshot, previous, alpha, quality.plague_details
+            )
+        self.indicator_shapes.draw()
+
+        if not quality.plague_details:
+            return
+
+        for plague in snapshot.plagues:
+            # Mostrar o multiplicador
+            if plague.state == PlagueState.CONSUMING and plague.multiplier > 1.0:
+                arcade.draw_text(
+                    f"x{plague.multiplier:.1f}",
+                    plague.x - 15,
+                    plague.y - Configs.CELL_SIZE // 2 - 15,  # Abaixo da praga
+                    arcade.color.RED,
+                    12,  # tamanho da fonte
+                    bold=True,
+                )
+
+    def _build_indicator_shapes(self, snapshot, previous, alpha, plague_details):
+        shapes = ShapeElementList()
+
+        def add_bar(left, bottom, width, color):
+            if width > 0:
+                shapes.append(
+                    create_rectangle_filled(
+                        left + width / 2, bottom + 2, width, 4, color
+                    )
+                )
+
+        for index, cell in enumerate(snapshot.cells):
+            if cell.crop_type is None:
+                continue
+
+            # Interpolar HP e crescimento com o estado anterior da mesma cultura
+            hp = cell.hp
+            growth_progress = cell.growth_progress
+            before = previous.cells[index]
+            if before.crop_type == cell.crop_type:
+                hp = lerp(before.hp, hp, alpha)
+                if before.growth_stage == cell.growth_stage:
+                    growth_progress = lerp(
+                        before.growth_progress, growth_progress, alpha
+                    )
+
+            left = cell.x - 20
+            bottom = cell.y - Configs.CELL_SIZE // 2
+
+            # Barra de HP, 6 pixels acima da barra de progresso: fundo preto e
+            # preenchimento verde/amarelo/vermelho dependendo do HP
+            hp_progress = hp / 100
+            hp_color = (
+                arcade.color.GREEN
+                if hp_progress > 0.6
+                else arcade.color.YELLOW if hp_progress > 0.3 else arcade.color.RED
+            )
+            add_bar(left, bottom + 6, 40, arcade.color.BLACK)
+            add_bar(left, bottom + 6, 40 * hp_progress, hp_color)
+
+            # Barra de progresso apenas se não estiver pronta para colheita
+            if cell.growth_stage != GrowthStage.READY:
+                add_bar(left, bottom, 40, arcade.color.BLACK)
+                add_bar(left, bottom, 40 * growth_progress, arcade.color.BABY_BLUE)
+
+        if plague_details:
+            for plague in snapshot.plagues:
+                if plague.state != PlagueState.CONSUMING:
+                    continue
+                # Linhas entre pragas adjacentes
+                for adjacent_x, adjacent_y in plague.adjacent:
+                    shapes.append(
+                        create_line(
+                            plague.x,
+                            plague.y,
+                            adjacent_x,
+                            adjacent_y,
+                            arcade.color.RED,
+                            2,  # espessura da linha
+                        )
+                    )
+
+        return shapes
+
+    def _draw_risk_overlay(self, snapshot, governor):
+        if self.risk_key is None or governor.is_due(governor.quality.overlay_interval):
+            key = tuple(cell.risk_cluster_size for cell in snapshot.cells)
+            if key != self.risk_key:
+                self.risk_key = key
+                self.risk_shapes = self._build_risk_shapes(snapshot)
+
+        if self.risk_shapes is not None:
+            self.risk_shapes.draw()
+
+    def _build_risk_shapes(self, snapshot):
+        # Quanto maior a mancha vulnerável, mais forte o destaque
+        largest = snapshot.largest_risk_cluster
+        if largest == 0:
+            return None
+
+        shapes = ShapeElementList()
+        for cell in snapshot.cells:
+            if cell.risk_cluster_size == 0:
+                continue
+
+            opacity = int(40 + 140 * cell.risk_cluster_size / largest)
+            shapes.append(
+                create_rectangle_filled(
+                    cell.x,
+                    cell.y,
+                    Configs.CELL_SIZE,
+                    Configs.CELL_SIZE,
+                    (*arcade.color.ORANGE_RED[:3], opacity),
+                )
+            )
+        return shapes
+
+    def _draw_forecast_overlay(self, snapshot, forecast, governor):
+        if len(forecast.probabilities) != len(snapshot.cells):
+            return
+
+        if self.forecast_key is None or governor.is_due(
+            governor.quality.overlay_interval
+        ):
+            # A previsão pode ser um pouco mais antiga que o estado desenhado:
+            # só as culturas vulneráveis que ainda existem são destacadas
+            vulnerable = snapshot.vulnerable_crop_types
+            shown = tuple(
+                index
+                for index, (cell, probability) in enumerate(
+                    zip(snapshot.cells, forecast.probabilities)
+                )
+                if cell.crop_type in vulnerable and probability > 0
+            )
+            key = (forecast.tick, shown)
+            if key != self.forecast_key:
+                self.forecast_key = key
+                self._build_forecast_overlay(snapshot, forecast, shown)
+
+        if self.forecast_shapes is not None:
+            self.forecast_shapes.draw()
+            self.forecast_text.draw()
+
+    def _build_forecast_overlay(self, snapshot, forecast, shown):
+        if not shown:
+            self.forecast_shapes = None
+            self.forecast_text = None
+            self.forecast_labels = []
+            return
+
+        self.forecast_shapes = ShapeElementList()
+        self.forecast_text = Batch()
+        # Os textos ficam vivos enquanto o lote os desenha
+        self.forecast_labels = []
+        for index in shown:
+            cell = snapshot.cells[index]
+            probability = forecast.probabilities[index]
+            self.forecast_shapes.append(
+                create_rectangle_filled(
+                    cell.x,
+                    cell.y,
+                    Configs.CELL_SIZE,
+                    Configs.CELL_SIZE,
+                    (*arcade.color.PURPLE[:3], int(30 + 150 * probability)),
+                )
+            )
+            self.forecast_labels.append(
+                arcade.Text(
+                    f"{probability:.0%}",
+                    cell.x - Configs.CELL_SIZE // 2 + 4,
+                    cell.y + Configs.CELL_SIZE // 2 - 16,
+                    arcade.color.WHITE,
+                    10,
+                    bold=True,
+                    batch=self.forecast_text,
+                )
+            )
+
+    def _draw_selection(self, snapshot, selection):
+        (row_start, col_start), (row_end, col_end) = selection
+        first = snapshot.cells[
+            min(row_start, row_end) * snapshot.num_cols + min(col_start, col_end)
+        ]
+        last = snapshot.cells[
+            max(row_start, row_end) * snapshot.num_cols + max(col_start, col_end)
+        ]
+
+        arcade.draw_lrbt_rectangle_outline(
+            left=first.x - Configs.CELL_SIZE // 2,
+            right=last.x + Configs.CELL_SIZE // 2,
+            bottom=first.y - Configs.CELL_SIZE // 2,
+            top=last.y + Configs.CELL_SIZE // 2,
+            color=arcade.color.GOLD,
+            border_width=2,
+        )
@@ -0,0 +1,122 @@
+from typing import Dict, List, Set
+
+
+class RiskClusters:
+    """Componentes conexos de culturas vulneráveis (manchas "em risco").
+
+    Uma praga só se espalha entre culturas vizinhas de um tipo vulnerável,
+    então cada componente é o alcance máximo de uma infestação. Os
+    componentes são mantidos incrementalmente com union-find: plantar une a
+    célula aos vizinhos; remover uma cultura recalcula apenas o componente
+    que a continha.
+    """
+
+    def __init__(self, grid, vulnerable_crop_types=()):
+        self.grid = grid
+        self.vulnerable_crop_types = set(vulnerable_crop_types)
+
+        size = grid.num_rows * grid.num_cols
+        self.parent = list(range(size))
+        self.at_risk = [False] * size
+        # Raiz -> índices do componente; só existe para raízes em risco
+        self.members: Dict[int, Set[int]] = {}
+
+        self.rebuild()
+
+    def set_vulnerable_types(self, vulnerable_crop_types):
+        self.vulnerable_crop_types = set(vulnerable_crop_types)
+        self.rebuild()
+
+    def rebuild(self):
+        for index in range(len(self.parent)):
+            self.parent[index] = index
+            self.at_risk[index] = False
+        self.members.clear()
+
+        for row in self.grid.cells:
+            for cell in row:
+                self.on_crop_added(cell)
+
+    def _is_vulnerable(self, cell) -> bool:
+        crop = cell.crop
+        return (
+            crop is not None and crop.type in self.vulnerable_crop_types and crop.hp > 0
+        )
+
+    def _index(self, cell) -> int:
+        return cell.row * self.grid.num_cols + cell.col
+
+    def find(self, index) -> int:
+        parent = self.parent
+        root = index
+        while parent[root] != root:
+            root = parent[root]
+        # Compressão de caminho
+        while parent[index] != root:
+            parent[index], index = root, parent[index]
+        return root
+
+    def _union(self, first, second):
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+
+        # União por tamanho: o conjunto menor é anexado ao maior
+        if len(self.members[first]) < len(self.members[second]):
+            first, second = second, first
+        self.parent[second] = first
+        self.members[first] |= self.members.pop(second)
+
+    def _add_index(self, index):
+        self.at_risk[index] = True
+        self.parent[index] = index
+        self.members[index] = {index}
+
+        for neighbour in self.grid.neighbour_indices[index]:
+            if self.at_risk[neighbour]:
+                self._union(index, neighbour)
+
+    def on_crop_added(self, cell):
+        if not self._is_vulnerable(cell):
+            return
+
+        index = self._index(cell)
+        if not self.at_risk[index]:
+            self._add_index(index)
+
+    def on_crops_removed(self, cells):
+        # Agrupa as remoções por componente, recalculando cada um uma vez
+        removed_by_root: Dict[int, Set[int]] = {}
+        for cell in cells:
+            index = self._index(cell)
+            if self.at_risk[index]:
+                removed_by_root.setdefault(self.find(index), set()).add(index)
+
+        for root, removed in removed_by_root.items():
+            survivors = self.members.pop(root) - removed
+            for index in removed:
+                self.at_risk[index] = False
+                self.parent[index] = index
+
+            # Recalcula localmente: só as células do componente afetado
+            for index in survivors:
+                self.at_risk[index] = False
+            for index in survivors:
+                self._add_index(index)
+
+    def cluster_size(self, row, col) -> int:
+        index = row * self.grid.num_cols + col
+        if not self.at_risk[index]:
+            return 0
+        return len(self.members[self.find(index)])
+
+    def clusters(self) -> List[List[tuple[int, int]]]:
+        num_cols = self.grid.num_cols
+        return [
+            [divmod(index, num_cols) for index in sorted(members)]
+            for members in self.members.values()
+        ]
+
+    @property
+    def largest_cluster_size(self) -> int:
+        return max((len(members) for members in self.members.values()), default=0)
@@ -7,4 +7,47 @@ class Configs:
     GRID_COLS = 5
     CELL_SIZE = 64
 
+    # Vizinhança do tabuleiro: "square4", "square8" ou "hex"
+    GRID_TOPOLOGY = "square4"
+    # Bordas contínuas (toro): células da borda são vizinhas das opostas
+    GRID_WRAP = False
+
+    # Pragas sem vizinho vulnerável atravessam o campo em busca da cultura
+    # vulnerável mais próxima (células por segundo), em vez de morrer; se não
+    # chegarem a uma dentro do tempo limite (segundos), morrem
+    PLAGUE_SEARCH = False
+    PLAGUE_SEARCH_SPEED = 2.0
+    PLAGUE_SEARCH_TIMEOUT = 8.0
+
+    # Simulação em thread própria, com taxa fixa (ticks por segundo)
+    THREADED_SIMULATION = False
+    SIMULATION_RATE = 30
+    # Tempo máximo de processamento da simulação por quadro, em segundos
+    SIMULATION_BUDGET = 0.008
+    # Maior intervalo de tempo real considerado em um único quadro
+    MAX_FRAME_TIME = 0.25
+
+    # Reduz detalhes visuais quando o trabalho de um quadro (atualização e
+    # desenho, em segundos) passa do orçamento, e os restaura com folga
+    ADAPTIVE_QUALITY = True
+    FRAME_BUDGET = 0.012
+
+    # Telemetria de eventos (None desliga a gravação)
+    TELEMETRY_DIR = None
+    TELEMETRY_BUFFER_SIZE = 4096
+
+    # Previsão de infestação (tecla V): janela prevista em segundos, partidas
+    # simuladas por previsão, passo do modelo e intervalo entre atualizações
+    FORECAST_HORIZON = 10.0
+    FORECAST_RUNS = 64
+    FORECAST_STEP = 0.25
+    FORECAST_INTERVAL = 0.5
+
+    # Nome do bloco de memória compartilhada com o estado do tabuleiro, lido
+    # por ferramentas externas com game.board_export.attach_board (None desliga)
+    BOARD_EXPORT_NAME = None
+
+    # Mede objetos e memória retidos a cada troca de tela
+    MEMORY_DIAGNOSTICS = False
+
     STORY_TEXT = "In a world ravaged by climate change, you are a fearless farmer facing the challenge of farming amidst a relentless pest. This threat consumes crops, leaving the soil sterile and quickly spreading to crops of the same type, forming devastating infestations.\n\nEvery choice you make is crucial. Should you use harsh pesticides, risking the environment? Or should you adopt sustainable techniques, such as polyculture, to strengthen the resilience of your crops?\n\nThe future of your farm and the world is in your hands. The battle for survival and sustainability is just beginning. What strategies will you adopt to meet this challenge and prove that sustainable farming is possible?"
@@ -0,0 +1,92 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+
+@dataclass
+class MemorySnapshot:
+    label: str
+    restarts: int
+    traced_bytes: int
+    live_objects: Dict[str, int] = field(default_factory=dict)
+
+
+class MemoryDiagnostics:
+    """Mede a memória retida a cada troca de tela.
+
+    Em cada transição é feito um ``gc.collect()`` seguido da contagem de
+    instâncias vivas dos tipos monitorados e do total alocado segundo o
+    ``tracemalloc``. O crescimento é reportado por reinício de partida, de
+    modo que vazamentos aparecem como valores que sobem a cada reinício.
+    """
+
+    def __init__(self, tracked_types: Dict[str, type]):
+        self.tracked_types = tracked_types
+        self.snapshots: List[MemorySnapshot] = []
+        self.restarts = 0
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def count_live_objects(self) -> Dict[str, int]:
+        counts = dict.fromkeys(self.tracked_types, 0)
+        for obj in gc.get_objects():
+            for name, tracked_type in self.tracked_types.items():
+                if isinstance(obj, tracked_type):
+                    counts[name] += 1
+        return counts
+
+    def take_snapshot(self, label: str, restart=False) -> MemorySnapshot:
+        if restart:
+            self.restarts += 1
+
+        gc.collect()
+        traced_bytes, _ = tracemalloc.get_traced_memory()
+        snapshot = MemorySnapshot(
+            label=label,
+            restarts=self.restarts,
+            traced_bytes=traced_bytes,
+            live_objects=self.count_live_objects(),
+        )
+        self.snapshots.append(snapshot)
+        print(self.format_snapshot(snapshot))
+        return snapshot
+
+    def growth_per_restart(self) -> Dict[str, float]:
+        """Crescimento médio por reinício, comparando o primeiro e o último."""
+        restarts = [s for s in self.snapshots if s.restarts > 0]
+        if len(restarts) < 2:
+            return {}
+
+        first, last = restarts[0], restarts[-1]
+        count = last.restarts - first.restarts
+        if count == 0:
+            return {}
+
+        growth = {
+            name: (last.live_objects[name] - first.live_objects[name]) / count
+            for name in self.tracked_types
+        }
+        growth["traced_bytes"] = (last.traced_bytes - first.traced_bytes) / count
+        return growth
+
+    def format_snapshot(self, snapshot: MemorySnapshot) -> str:
+        objects = ", ".join(
+            f"{name}={count}" for name, count in snapshot.live_objects.items()
+        )
+        line = (
+            f"[memory] {snapshot.label} (restart {snapshot.restarts}): "
+            f"{snapshot.traced_bytes / 1024:.0f} KiB traced; {objects}"
+        )
+
+        growth = self.growth_per_restart()
+        if growth and snapshot.restarts > 0:
+            objects_growth = ", ".join(
+                f"{name}={growth[name]:+.1f}" for name in self.tracked_types
+            )
+            line += (
+                f"; growth/restart {growth['traced_bytes'] / 1024:+.1f} KiB, "
+                f"{objects_growth}"
+            )
+        return line
@@ -0,0 +1,146 @@
+import heapq
+from typing import List, Set
+
+UNREACHABLE = 1 << 30
+
+
+class DistanceField:
+    """Distância de cada célula até a cultura vulnerável livre mais próxima.
+
+    É uma busca em largura com múltiplas origens (as culturas vulneráveis que
+    nenhuma praga reclamou), compartilhada por todas as pragas em busca: cada
+    passo de uma praga só consulta os vizinhos da célula atual. O campo é
+    mantido incrementalmente: plantar ou liberar uma cultura só propaga as
+    distâncias que diminuem; remover ou reclamar uma cultura recalcula apenas
+    as células cuja origem mais próxima era ela.
+    """
+
+    def __init__(self, grid, vulnerable_crop_types=()):
+        self.grid = grid
+        self.vulnerable_crop_types = set(vulnerable_crop_types)
+
+        size = grid.num_rows * grid.num_cols
+        self.distance = [UNREACHABLE] * size
+        # Origem mais próxima de cada célula (-1 se inalcançável)
+        self.nearest = [-1] * size
+        self.sources: Set[int] = set()
+        # Culturas com praga: não são origens até serem liberadas
+        self.claimed: Set[int] = set()
+
+        self.rebuild()
+
+    def set_vulnerable_types(self, vulnerable_crop_types):
+        self.vulnerable_crop_types = set(vulnerable_crop_types)
+        self.rebuild()
+
+    def rebuild(self):
+        for index in range(len(self.distance)):
+            self.distance[index] = UNREACHABLE
+            self.nearest[index] = -1
+
+        self.sources = {
+            self._index(cell)
+            for row in self.grid.cells
+            for cell in row
+            if self._is_vulnerable(cell)
+        }
+        self._propagate([(0, index, index) for index in self.sources])
+
+    def _is_vulnerable(self, cell) -> bool:
+        crop = cell.crop
+        return (
+            crop is not None
+            and crop.type in self.vulnerable_crop_types
+            and crop.hp > 0
+            and self._index(cell) not in self.claimed
+        )
+
+    def _index(self, cell) -> int:
+        return cell.row * self.grid.num_cols + cell.col
+
+    def _propagate(self, heap):
+        """Relaxa as distâncias a partir de (distância, célula, origem)."""
+        heapq.heapify(heap)
+        distance = self.distance
+        nearest = self.nearest
+        neighbour_indices = self.grid.neighbour_indices
+
+        while heap:
+            current, index, source = heapq.heappop(heap)
+            if current >= distance[index]:
+                continue
+
+            distance[index] = current
+            nearest[index] = source
+            for neighbour in neighbour_indices[index]:
+                if current + 1 < distance[neighbour]:
+                    heapq.heappush(heap, (current + 1, neighbour, source))
+
+    def on_crop_added(self, cell):
+        if not self._is_vulnerable(cell):
+            return
+
+        index = self._index(cell)
+        if index not in self.sources:
+            self.sources.add(index)
+            self._propagate([(0, index, index)])
+
+    def on_crops_removed(self, cells):
+        indices = {self._index(cell) for cell in cells}
+        self.claimed -= indices
+        self._remove_sources(indices)
+
+    def claim(self, cell):
+        """Uma praga passou a consumir a cultura da célula."""
+        index = self._index(cell)
+        self.claimed.add(index)
+        self._remove_sources({index})
+
+    def release(self, cell):
+        """A praga que consumia a cultura da célula foi eliminada."""
+        self.claimed.discard(self._index(cell))
+        self.on_crop_added(cell)
+
+    def _remove_sources(self, indices):
+        removed = indices & self.sources
+        if not removed:
+            return
+        self.sources -= removed
+
+        # Região afetada: células cuja origem mais próxima foi removida. Ela é
+        # conexa a partir das próprias origens, então basta percorrê-la.
+        nearest = self.nearest
+        neighbour_indices = self.grid.neighbour_indices
+        region = list(removed)
+        seen = set(removed)
+        for index in region:
+            for neighbour in neighbour_indices[index]:
+                if neighbour not in seen and nearest[neighbour] in removed:
+                    seen.add(neighbour)
+                    region.append(neighbour)
+
+        for index in region:
+            self.distance[index] = UNREACHABLE
+            nearest[index] = -1
+
+        # Reabastece a região a partir da sua borda, que não mudou
+        heap = []
+        for index in region:
+            for neighbour in neighbour_indices[index]:
+                if nearest[neighbour] != -1:
+                    heap.append(
+                        (self.distance[neighbour] + 1, index, nearest[neighbour])
+                    )
+        self._propagate(heap)
+
+    def steps_towards_target(self, index) -> List[int]:
+        """Vizinhos de ``index`` mais próximos de uma cultura vulnerável livre."""
+        distance = self.distance
+        neighbours = self.grid.neighbour_indices[index]
+        best = min((distance[n] for n in neighbours), default=UNREACHABLE)
+        if best == UNREACHABLE:
+            return []
+        return [n for n in neighbours if distance[n] == best]
+
+    def is_reachable(self, index) -> bool:
+        return self.distance[index] != UNREACHABLE
@@ -0,0 +1,244 @@
+import random
+import threading
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple
+from .configs import Configs
+from .model import Plague, PlagueManager, PlagueState
+
+
+class Forecast(NamedTuple):
+    tick: int  # tick do estado usado na previsão
+    horizon: float
+    # Probabilidade de cada célula (row-major) ter a cultura consumida
+    probabilities: Tuple[float, ...]
+
+
+class ForecastModel:
+    """Estima por Monte Carlo quais culturas serão consumidas em breve.
+
+    Cada execução reproduz, em passos de ``step`` segundos, as regras do
+    ``PlagueManager`` a partir de um ``BoardSnapshot``: surgimento com tempo
+    de espera e limite de pragas, dano com o multiplicador de cooperação e o
+    salto para uma cultura vizinha vulnerável. Com ``PLAGUE_SEARCH``, uma
+    praga sem vizinho vulnerável segue para a cultura livre mais próxima e
+    chega depois de ``distância / PLAGUE_SEARCH_SPEED`` segundos, se antes
+    do ``PLAGUE_SEARCH_TIMEOUT``; as pragas em busca contam no limite. O
+    caminho em si não é simulado (uma praga não espera por outra no
+    caminho), o jogador não age e as culturas não crescem durante a previsão.
+    """
+
+    def __init__(
+        self,
+        neighbour_indices: Sequence[Tuple[int, ...]],
+        horizon=Configs.FORECAST_HORIZON,
+        runs=Configs.FORECAST_RUNS,
+        step=Configs.FORECAST_STEP,
+        seed=None,
+    ):
+        self.neighbour_indices = neighbour_indices
+        self.horizon = horizon
+        self.runs = runs
+        self.step = step
+        # Gerador próprio: não interfere na sequência aleatória da partida
+        self.rng = random.Random(seed)
+
+    def forecast(
+        self, snapshot, cancelled: Callable[[], bool] = lambda: False
+    ) -> Optional[Forecast]:
+        vulnerable = set(snapshot.vulnerable_crop_types)
+        initial_hp = [
+            cell.hp if cell.crop_type in vulnerable and cell.hp > 0 else 0.0
+            for cell in snapshot.cells
+        ]
+        targets = [index for index, hp in enumerate(initial_hp) if hp > 0]
+        consumed_counts = [0] * len(initial_hp)
+
+        if targets:
+            initial_plagues = {
+                plague.cell_index: plague.damage_per_second
+                for plague in snapshot.plagues
+                if plague.state == PlagueState.CONSUMING
+            }
+            initial_searchers = [
+                (
+                    plague.cell_index,
+                    Configs.PLAGUE_SEARCH_TIMEOUT - plague.search_time,
+                    plague.damage_per_second,
+                )
+                for plague in snapshot.plagues
+                if plague.state == PlagueState.SEARCHING
+            ]
+            for _ in range(self.runs):
+                if cancelled():
+                    return None
+                self._run(
+                    snapshot,
+                    initial_hp,
+                    initial_plagues,
+                    initial_searchers,
+                    targets,
+                    consumed_counts,
+                )
+
+        return Forecast(
+            tick=snapshot.tick,
+            horizon=self.horizon,
+            probabilities=tuple(count / self.runs for count in consumed_counts),
+        )
+
+    def _run(
+        self,
+        snapshot,
+        initial_hp,
+        initial_plagues,
+        initial_searchers,
+        targets,
+        consumed_counts,
+    ):
+        rng = self.rng
+        dt = self.step
+        neighbour_indices = self.neighbour_indices
+
+        hp = list(initial_hp)
+        plagues = dict(initial_plagues)  # célula -> dano por segundo
+        time_since_spawn = snapshot.time_since_spawn
+        crops_consumed = snapshot.crops_consumed
+
+        # Pragas em busca: [tempo até chegar, célula de destino, tempo até
+        # desistir, dano por segundo]
+        searchers = []
+        for index, time_left, damage_per_second in initial_searchers:
+            self._start_search(
+                searchers, index, time_left, damage_per_second, hp, plagues
+            )
+
+        for _ in range(int(self.horizon / dt)):
+            time_since_spawn += dt
+            max_plagues = PlagueManager.max_plagues_for(crops_consumed)
+            if (
+                len(plagues) + len(searchers) < max_plagues
+                and time_since_spawn >= snapshot.spawn_cooldown
+            ):
+                candidates = [i for i in targets if hp[i] > 0 and i not in plagues]
+                if candidates:
+                    plagues[rng.choice(candidates)] = Plague.DAMAGE_PER_SECOND
+                time_since_spawn = 0.0
+
+            for searcher in list(searchers):
+                searcher[0] -= dt
+                searcher[2] -= dt
+                if searcher[2] <= 0:
+                    searchers.remove(searcher)
+                elif searcher[0] <= 0:
+                    searchers.remove(searcher)
+                    _, index, time_left, damage_per_second = searcher
+                    if hp[index] > 0 and index not in plagues:
+                        plagues[index] = damage_per_second
+                    else:
+                        # Outra praga chegou antes: procura a próxima
+                        self._start_search(
+                            searchers, index, time_left, damage_per_second, hp, plagues
+                        )
+
+            if not plagues:
+                continue
+
+            for index in list(plagues):
+                damage_per_second = plagues[index]
+                adjacent = sum(
+                    1 for neighbour in neighbour_indices[index] if neighbour in plagues
+                )
+                multiplier = min(1 + adjacent * 0.5, 3.0)
+                hp[index] -= damage_per_second * dt * multiplier
+                if hp[index] > 0:
+                    continue
+
+                crops_consumed += 1
+                consumed_counts[index] += 1
+                del plagues[index]
+                options = [
+                    neighbour
+                    for neighbour in neighbour_indices[index]
+                    if hp[neighbour] > 0 and neighbour not in plagues
+                ]
+                if options:
+                    plagues[rng.choice(options)] = damage_per_second
+                elif Configs.PLAGUE_SEARCH:
+                    self._start_search(
+                        searchers,
+                        index,
+                        Configs.PLAGUE_SEARCH_TIMEOUT,
+                        damage_per_second,
+                        hp,
+                        plagues,
+                    )
+
+    def _start_search(
+        self, searchers, start, time_left, damage_per_second, hp, plagues
+    ):
+        """Põe em ``searchers`` uma praga a caminho da cultura livre mais próxima.
+
+        Sem cultura alcançável, a praga morre, como no jogo.
+        """
+        neighbour_indices = self.neighbour_indices
+        seen = {start}
+        frontier = [start]
+        distance = 0
+        while frontier:
+            found = [i for i in frontier if hp[i] > 0 and i not in plagues]
+            if found:
+                searchers.append(
+                    [
+                        distance / Configs.PLAGUE_SEARCH_SPEED,
+                        self.rng.choice(found),
+                        time_left,
+                        damage_per_second,
+                    ]
+                )
+                return
+
+            next_frontier = []
+            for index in frontier:
+                for neighbour in neighbour_indices[index]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+            distance += 1
+
+
+class ForecastWorker(threading.Thread):
+    """Atualiza a previsão em segundo plano, na própria taxa.
+
+    A interface entrega o estado mais recente com ``submit`` e lê o último
+    resultado em ``forecast``; nenhum dos dois lados espera pelo outro.
+    Estados que chegam durante um cálculo substituem os anteriores, então a
+    previsão sempre parte do estado mais novo disponível.
+    """
+
+    def __init__(self, neighbour_indices, interval=Configs.FORECAST_INTERVAL, **kwargs):
+        super().__init__(name="forecast", daemon=True)
+        self.model = ForecastModel(neighbour_indices, **kwargs)
+        self.interval = interval
+        self.forecast: Optional[Forecast] = None
+
+        self._snapshot = None
+        self._stop_event = threading.Event()
+
+    def submit(self, snapshot):
+        self._snapshot = snapshot
+
+    def run(self):
+        last_tick = None
+        while not self._stop_event.is_set():
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.tick != last_tick:
+                forecast = self.model.forecast(snapshot, self._stop_event.is_set)
+                if forecast is not None:
+                    self.forecast = forecast
+                    last_tick = snapshot.tick
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
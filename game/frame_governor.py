@@ -0,0 +1,97 @@
+from typing import NamedTuple
+from .configs import Configs
+
+
+class QualityLevel(NamedTuple):
+    name: str
+    label_interval: int  # quadros entre atualizações dos labels do HUD
+    indicator_interval: int  # quadros entre reconstruções dos indicadores
+    plague_details: bool  # texto do multiplicador e linhas de cooperação
+    crop_interval: int  # quadros entre atualizações das texturas das culturas
+    overlay_interval: int  # quadros entre atualizações das camadas de risco/previsão
+
+
+# Do mais completo ao mais econômico; cada nível mantém os cortes do anterior
+QUALITY_LEVELS = (
+    QualityLevel("full", 1, 1, True, 1, 1),
+    QualityLevel("reduced-hud", 10, 2, True, 1, 4),
+    QualityLevel("no-plague-details", 10, 4, False, 1, 8),
+    QualityLevel("minimal", 20, 8, False, 4, 16),
+)
+
+
+class FrameGovernor:
+    """Ajusta o nível de qualidade ao tempo gasto por quadro.
+
+    O tempo de cada quadro é suavizado por média móvel exponencial. Se a
+    média passa do ``budget`` por ``degrade_after`` quadros seguidos, a
+    qualidade desce um nível; se fica abaixo de ``headroom * budget`` por
+    ``restore_after`` quadros, sobe um nível. A restauração é mais lenta que
+    a degradação para não oscilar entre dois níveis. Com ``adaptive`` falso o
+    nível fica fixo em ``level`` e ``record`` só conta os quadros.
+    """
+
+    def __init__(
+        self,
+        budget=Configs.FRAME_BUDGET,
+        degrade_after=15,
+        restore_after=120,
+        headroom=0.6,
+        smoothing=0.1,
+        adaptive=True,
+        level=0,
+    ):
+        self.budget = budget
+        self.degrade_after = degrade_after
+        self.restore_after = restore_after
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.adaptive = adaptive
+
+        self.level = level
+        self.frame = 0
+        self.average_frame_time = 0.0
+        self._frames_over = 0
+        self._frames_under = 0
+
+    @property
+    def quality(self) -> QualityLevel:
+        return QUALITY_LEVELS[self.level]
+
+    def is_due(self, interval: int) -> bool:
+        """Se um trabalho feito a cada ``interval`` quadros roda neste quadro."""
+        return self.frame % interval == 0
+
+    def record(self, frame_time: float):
+        self.frame += 1
+        self.average_frame_time += self.smoothing * (
+            frame_time - self.average_frame_time
+        )
+
+        if not self.adaptive:
+            return
+        if self.average_frame_time > self.budget:
+            self._frames_over += 1
+            self._frames_under = 0
+            if (
+                self._frames_over >= self.degrade_after
+                and self.level < len(QUALITY_LEVELS) - 1
+            ):
+                self._set_level(self.level + 1)
+        elif self.average_frame_time < self.budget * self.headroom:
+            self._frames_under += 1
+            self._frames_over = 0
+            if self._frames_under >= self.restore_after and self.level > 0:
+                self._set_level(self.level - 1)
+        else:
+            self._frames_over = 0
+            self._frames_under = 0
+
+    def _set_level(self, level):
+        self.level = level
+        self._frames_over = 0
+        self._frames_under = 0
+        print(
+            f"Quality level: {self.quality.name} "
+            f"(frame time {self.average_frame_time * 1000:.1f} ms)"
+        )
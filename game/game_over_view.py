@@ -36,23 +36,21 @@ class GameOverView(UIView):
         )
 
         # Add stats
-        v_box.add(
-            arcade.gui.UILabel(
-                text=f"Crops Harvested: {self.crops_harvested}",
-                font_size=18,
-                text_color=arcade.color.BLACK,
-                align="center",
-            )
+        self.harvested_label = arcade.gui.UILabel(
+            text=f"Crops Harvested: {self.crops_harvested}",
+            font_size=18,
+            text_color=arcade.color.BLACK,
+            align="center",
         )
+        v_box.add(self.harvested_label)
 
-        v_box.add(
-            arcade.gui.UILabel(
-                text=f"Plagues Eliminated: {self.plagues_eliminated}",
-                font_size=18,
-                text_color=arcade.color.BLACK,
-                align="center",
-            )
+        self.eliminated_label = arcade.gui.UILabel(
+            text=f"Plagues Eliminated: {self.plagues_eliminated}",
+            font_size=18,
+            text_color=arcade.color.BLACK,
+            align="center",
         )
+        v_box.add(self.eliminated_label)
 
         # Add buttons to vertical box layout
         v_box.add(restart_button)
@@ -60,12 +58,19 @@ class GameOverView(UIView):
 
         @restart_button.event("on_click")
         def _(event):
-            from .game_view import GameView
-
-            game_view = GameView()
-            game_view.setup()
-            self.window.show_view(game_view)
+            self.window.scenes.show_game()
 
         @quit_button.event("on_click")
         def _(event):
             self.window.close()
+
+    def set_stats(self, crops_harvested, plagues_eliminated):
+        # Reaproveita a tela entre partidas, atualizando só os textos
+        self.crops_harvested = crops_harvested
+        self.plagues_eliminated = plagues_eliminated
+        self.harvested_label.text = f"Crops Harvested: {crops_harvested}"
+        self.eliminated_label.text = f"Plagues Eliminated: {plagues_eliminated}"
+
+    def teardown(self):
+        # Remove os widgets e, com eles, os handlers que referenciam a tela
+        self.ui.clear()
@@ -0,0 +1,355 @@
+import contextlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from .configs import Configs
+from .model import CropFactory, PlayerAction
+from .simulation import AreaCommand, CellCommand, Simulation
+from .telemetry import NullTelemetry
+
+# Valor de cada célula de um layout: 0 é vazio, k > 0 é CROP_TYPES[k - 1]
+CROP_TYPES = tuple(CropFactory._crop_configs)
+
+
+def crop_cost(value: int) -> int:
+    if value == 0:
+        return 0
+    return CropFactory._crop_configs[CROP_TYPES[value - 1]].value
+
+
+def symmetry_permutations(
+    num_rows, num_cols, topology=Configs.GRID_TOPOLOGY
+) -> List[Tuple[int, ...]]:
+    """Simetrias do tabuleiro como permutações dos índices row-major.
+
+    Tabuleiros quadrados têm as 8 simetrias do quadrado; retangulares, as 4
+    reflexões e rotações de 180 graus. Na grade hexagonal (linhas ímpares
+    deslocadas) só a reflexão vertical preserva a vizinhança, e apenas com
+    número ímpar de linhas.
+    """
+    if topology == "hex":
+        transforms = [lambda r, c: (r, c)]
+        if num_rows % 2:
+            transforms.append(lambda r, c: (num_rows - 1 - r, c))
+    else:
+        transforms = [
+            lambda r, c: (r, c),
+            lambda r, c: (num_rows - 1 - r, c),
+            lambda r, c: (r, num_cols - 1 - c),
+            lambda r, c: (num_rows - 1 - r, num_cols - 1 - c),
+        ]
+        if num_rows == num_cols:
+            n = num_rows - 1
+            transforms += [
+                lambda r, c: (c, r),
+                lambda r, c: (n - c, n - r),
+                lambda r, c: (c, n - r),
+                lambda r, c: (n - c, r),
+            ]
+
+    return [
+        tuple(
+            row * num_cols + col
+            for row, col in (
+                transform(*divmod(index, num_cols))
+                for index in range(num_rows * num_cols)
+            )
+        )
+        for transform in transforms
+    ]
+
+
+class ZobristHasher:
+    """Hash de layouts atualizável célula a célula, uma vez por simetria.
+
+    Cada (célula, valor) tem uma chave aleatória de 64 bits e o hash de um
+    layout é o XOR das chaves das suas células; trocar o valor de uma célula
+    custa um XOR por simetria. A chave canônica, o menor hash entre todas as
+    simetrias, é igual para layouts equivalentes.
+    """
+
+    def __init__(self, num_rows, num_cols, topology=Configs.GRID_TOPOLOGY, seed=0):
+        self.permutations = symmetry_permutations(num_rows, num_cols, topology)
+
+        rng = random.Random(seed)
+        # Células vazias não contribuem: o tabuleiro vazio tem hash 0
+        self.keys = [
+            [0] + [rng.getrandbits(64) for _ in CROP_TYPES]
+            for _ in range(num_rows * num_cols)
+        ]
+
+    def hashes(self, cells: Sequence[int]) -> Tuple[int, ...]:
+        keys = self.keys
+        result = []
+        for permutation in self.permutations:
+            value = 0
+            for index, crop in enumerate(cells):
+                if crop:
+                    value ^= keys[permutation[index]][crop]
+            result.append(value)
+        return tuple(result)
+
+    def update(self, hashes, index, old, new) -> Tuple[int, ...]:
+        keys = self.keys
+        return tuple(
+            value ^ keys[permutation[index]][old] ^ keys[permutation[index]][new]
+            for value, permutation in zip(hashes, self.permutations)
+        )
+
+
+class Layout(NamedTuple):
+    cells: Tuple[int, ...]  # ordem row-major
+    hashes: Tuple[int, ...]  # um hash por simetria do tabuleiro
+    cost: int
+
+    @property
+    def key(self) -> int:
+        return min(self.hashes)
+
+
+@dataclass(frozen=True)
+class EvaluationSettings:
+    num_rows: int
+    num_cols: int
+    budget: int
+    vulnerable_crop_type: str
+    horizon: float = 60.0  # segundos simulados por partida
+    step: float = 1.0 / Configs.SIMULATION_RATE
+    harvest_interval: float = 1.0
+    topology: str = Configs.GRID_TOPOLOGY
+
+
+def simulate_layout(settings: EvaluationSettings, cells: Sequence[int], seed) -> int:
+    """Planta o layout, joga sem intervenção e conta as culturas que escaparam.
+
+    A única ação do jogador é colher, a cada ``harvest_interval``, as
+    culturas prontas e sem praga. A pontuação é o número de culturas colhidas
+    mais as que seguem no tabuleiro no fim do ``horizon``, ou seja, as
+    plantadas menos as consumidas pelas pragas. O dinheiro não serve: cada
+    cultura é vendida pelo mesmo valor que custou, então nenhum layout
+    termina com mais que o orçamento. O estado global do ``random`` é
+    restaurado no fim, então a função pode rodar no processo principal.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        simulation = Simulation(
+            settings.num_rows,
+            settings.num_cols,
+            telemetry=NullTelemetry(),
+            topology=settings.topology,
+        )
+        simulation.plague_manager.set_vulnerable_types({settings.vulnerable_crop_type})
+
+        player = simulation.player
+        player.money = settings.budget
+        player.select_action(PlayerAction.PLANT)
+        for index, crop in enumerate(cells):
+            if crop:
+                player.select_crop(CROP_TYPES[crop - 1])
+                simulation.apply(CellCommand(*divmod(index, settings.num_cols)))
+
+        player.select_action(PlayerAction.HARVEST)
+        everything = AreaCommand(0, 0, settings.num_rows - 1, settings.num_cols - 1)
+        steps_per_harvest = max(1, round(settings.harvest_interval / settings.step))
+        for tick in range(1, int(settings.horizon / settings.step) + 1):
+            simulation.step(settings.step)
+            if simulation.game_over:
+                break
+            if tick % steps_per_harvest == 0:
+                simulation.apply(everything)
+
+        simulation.close()
+        return simulation.crops_harvested + len(simulation.grid.crops)
+    finally:
+        random.setstate(state)
+
+
+def evaluate_layout(task) -> float:
+    """Pontuação média de um layout em várias partidas com sementes fixas."""
+    settings, cells, seeds = task
+    # O modelo imprime cada cultura criada; em milhares de partidas isso pesa
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        scores = [simulate_layout(settings, cells, seed) for seed in seeds]
+    return sum(scores) / len(scores)
+
+
+class LayoutOptimizer:
+    """Busca em feixe por layouts de plantio que perdem menos culturas para as pragas.
+
+    Cada layout é pontuado pela média de ``samples`` partidas simuladas, com
+    as mesmas sementes para todos os candidatos. As pontuações ficam numa
+    tabela de transposição indexada pela chave canônica do layout, de forma
+    que layouts equivalentes (inclusive por simetria) são avaliados uma única
+    vez. Os candidatos novos de cada rodada são avaliados em paralelo.
+    """
+
+    def __init__(
+        self,
+        settings: EvaluationSettings,
+        samples=8,
+        seed=0,
+        workers: Optional[int] = None,
+        beam_width=4,
+        neighbours_per_layout=16,
+    ):
+        if settings.budget < min(crop_cost(k) for k in range(1, len(CROP_TYPES) + 1)):
+            raise ValueError("Budget is too small to plant anything")
+
+        self.settings = settings
+        self.size = settings.num_rows * settings.num_cols
+        self.rng = random.Random(seed)
+        self.seeds = tuple(self.rng.getrandbits(32) for _ in range(samples))
+        # As simetrias usadas nas chaves são as da grade simulada
+        self.hasher = ZobristHasher(
+            settings.num_rows, settings.num_cols, settings.topology, seed=seed
+        )
+        self.beam_width = beam_width
+        self.neighbours_per_layout = neighbours_per_layout
+
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self._executor = None
+
+        self.table: Dict[int, float] = {}
+        self.evaluations = 0
+        self.table_hits = 0
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def make_layout(self, cells: Sequence[int]) -> Layout:
+        cells = tuple(cells)
+        return Layout(cells, self.hasher.hashes(cells), sum(map(crop_cost, cells)))
+
+    def _change(self, layout: Layout, index, new) -> Layout:
+        old = layout.cells[index]
+        cells = layout.cells[:index] + (new,) + layout.cells[index + 1 :]
+        return Layout(
+            cells,
+            self.hasher.update(layout.hashes, index, old, new),
+            layout.cost - crop_cost(old) + crop_cost(new),
+        )
+
+    def evaluate(self, layouts: Sequence[Layout]) -> List[float]:
+        pending = {}
+        for layout in layouts:
+            if layout.key in self.table or layout.key in pending:
+                self.table_hits += 1
+            else:
+                pending[layout.key] = layout.cells
+
+        if pending:
+            tasks = [(self.settings, cells, self.seeds) for cells in pending.values()]
+            if self.workers > 1:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(self.workers)
+                chunksize = max(1, len(tasks) // (self.workers * 4))
+                scores = self._executor.map(evaluate_layout, tasks, chunksize=chunksize)
+            else:
+                scores = map(evaluate_layout, tasks)
+
+            for key, score in zip(pending, scores):
+                self.table[key] = score
+            self.evaluations += len(pending)
+
+        return [self.table[layout.key] for layout in layouts]
+
+    def initial_layouts(self) -> List[Layout]:
+        """Monoculturas e policultura alternada, compactas ou em xadrez."""
+        num_cols = self.settings.num_cols
+        orders = [
+            list(range(self.size)),
+            sorted(range(self.size), key=lambda i: (sum(divmod(i, num_cols)) % 2, i)),
+        ]
+        patterns = [[k] for k in range(1, len(CROP_TYPES) + 1)]
+        patterns.append(list(range(1, len(CROP_TYPES) + 1)))
+
+        layouts = []
+        for order in orders:
+            for pattern in patterns:
+                cells = [0] * self.size
+                budget = self.settings.budget
+                for position, index in enumerate(order):
+                    crop = pattern[position % len(pattern)]
+                    if crop_cost(crop) > budget:
+                        break
+                    cells[index] = crop
+                    budget -= crop_cost(crop)
+                layouts.append(self.make_layout(cells))
+        return layouts
+
+    def random_neighbour(self, layout: Layout) -> Optional[Layout]:
+        """Planta, remove, troca o tipo ou move uma cultura, dentro do orçamento."""
+        rng = self.rng
+        budget = self.settings.budget
+        index = rng.randrange(self.size)
+        old = layout.cells[index]
+        new = rng.randrange(len(CROP_TYPES) + 1)
+        if new == old:
+            return None
+
+        if old and new == 0 and rng.random() < 0.5:
+            # Mover: a cultura vai para uma célula vazia qualquer
+            target = rng.randrange(self.size)
+            if layout.cells[target]:
+                return None
+            moved = self._change(layout, index, 0)
+            return self._change(moved, target, old)
+
+        if layout.cost - crop_cost(old) + crop_cost(new) > budget:
+            return None
+        return self._change(layout, index, new)
+
+    def search(self, rounds=50, patience=10) -> Tuple[Layout, float]:
+        beam = self.initial_layouts()
+        scores = self.evaluate(beam)
+        ranked = sorted(zip(scores, beam), key=lambda item: -item[0])
+        beam = [layout for _, layout in ranked[: self.beam_width]]
+        best_score, best = ranked[0]
+
+        stale_rounds = 0
+        for _ in range(rounds):
+            candidates = []
+            for layout in beam:
+                for _ in range(self.neighbours_per_layout):
+                    neighbour = self.random_neighbour(layout)
+                    if neighbour is not None:
+                        candidates.append(neighbour)
+
+            scores = self.evaluate(candidates)
+            pool = {layout.key: (self.table[layout.key], layout) for layout in beam}
+            for score, layout in zip(scores, candidates):
+                pool.setdefault(layout.key, (score, layout))
+
+            ranked = sorted(pool.values(), key=lambda item: -item[0])
+            beam = [layout for _, layout in ranked[: self.beam_width]]
+
+            if ranked[0][0] > best_score:
+                best_score, best = ranked[0]
+                stale_rounds = 0
+            else:
+                stale_rounds += 1
+                if stale_rounds >= patience:
+                    break
+
+        return best, best_score
+
+
+def format_layout(layout: Layout, num_cols) -> str:
+    """Layout como texto, com a primeira linha do tabuleiro embaixo."""
+    symbols = "." + "".join(crop_type[0].upper() for crop_type in CROP_TYPES)
+    rows = [
+        "".join(symbols[crop] for crop in layout.cells[start : start + num_cols])
+        for start in range(0, len(layout.cells), num_cols)
+    ]
+    return "\n".join(reversed(rows))
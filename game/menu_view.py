@@ -41,10 +41,12 @@ class MenuView(UIView):
 
         @start_button.event("on_click")
         def _(event):
-            from .story_view import StoryView
-
-            self.window.show_view(StoryView())
+            self.window.scenes.show_story()
 
         @quit_button.event("on_click")
         def _(event):
             self.window.close()
+
+    def teardown(self):
+        # Remove os widgets e, com eles, os handlers que referenciam a tela
+        self.ui.clear()
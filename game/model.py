@@ -0,0 +1,647 @@
+import itertools
+import random
+from enum import Enum
+from dataclasses import dataclass
+from .clusters import RiskClusters
+from .configs import Configs
+from .distance_field import DistanceField
+from .telemetry import NullTelemetry, TelemetryEvent
+from typing import Dict, Optional, List, Set
+
+
+class GrowthStage(Enum):
+    SEEDLING = 0
+    GROWING = 1
+    MATURE = 2
+    READY = 3
+
+    @property
+    def next_stage(self):
+        try:
+            return GrowthStage(self.value + 1)
+        except ValueError:
+            return self
+
+
+class PlayerAction(Enum):
+    PLANT = 0
+    HARVEST = 1
+    APPLY_PESTICIDE = 2
+
+
+class PlagueState(Enum):
+    SEARCHING = 0
+    CONSUMING = 1
+    DYING = 2
+
+
+class Soil:
+    ALIVE = 0
+    DEAD = 1
+
+    def __init__(self):
+        self.state = self.ALIVE
+
+    def set_alive(self):
+        self.state = self.ALIVE
+
+    def set_dead(self):
+        self.state = self.DEAD
+
+    @property
+    def is_alive(self):
+        return self.state == self.ALIVE
+
+    def kill(self):
+        self.state = self.DEAD
+
+
+@dataclass
+class CropConfig:
+    crop_type: str
+    growth_time: int
+    value: int
+    texture_paths: list[str]
+
+
+class CropFactory:
+    _crop_configs = {
+        "carrot": CropConfig(
+            crop_type="carrot",
+            growth_time=5,
+            value=20,
+            texture_paths=[
+                "assets/carrot_0.png",
+                "assets/carrot_1.png",
+                "assets/carrot_2.png",
+                "assets/carrot_3.png",
+            ],
+        ),
+        "potato": CropConfig(
+            crop_type="potato",
+            growth_time=6,
+            value=25,
+            texture_paths=[
+                "assets/potato_0.png",
+                "assets/potato_1.png",
+                "assets/potato_2.png",
+                "assets/potato_3.png",
+            ],
+        ),
+    }
+
+    @classmethod
+    def create_crop(
+        cls, crop_type: str, center_x: float, center_y: float, start_time: float
+    ) -> "Crop":
+        if crop_type not in cls._crop_configs:
+            raise ValueError(f"Unknown crop type: {crop_type}")
+
+        config = cls._crop_configs[crop_type]
+        crop = Crop(center_x, center_y, start_time, config)
+        # Garantir que o tipo da cultura está sendo definido
+        crop.type = crop_type
+        print(f"Created crop of type {crop_type} at ({center_x}, {center_y})")
+        return crop
+
+
+class Crop:
+    def __init__(
+        self, center_x: float, center_y: float, start_time: float, config: CropConfig
+    ):
+        self.center_x = center_x
+        self.center_y = center_y
+        self.type = config.crop_type  # Armazenar o tipo da cultura
+        self.growth_stage = GrowthStage.SEEDLING
+        self.start_time = start_time
+        self.hp = 100
+
+        self.growth_time = config.growth_time
+        self.value = config.value
+
+        print(f"Initialized crop of type {self.type}")
+
+    def update(self, current_time):
+        if self.growth_stage == GrowthStage.READY or self.hp <= 0:
+            return
+
+        time_elapsed = current_time - self.start_time
+        if time_elapsed >= self.growth_time:
+            self.growth_stage = self.growth_stage.next_stage
+            self.start_time = current_time
+
+    def damage(self, amount):
+        self.hp = max(0, self.hp - amount)
+
+    def growth_progress(self, current_time) -> float:
+        if self.growth_stage == GrowthStage.READY:
+            return 1.0
+        time_elapsed = current_time - self.start_time
+        return min(time_elapsed / self.growth_time, 1.0)
+
+    @property
+    def is_harvestable(self):
+        return self.growth_stage == GrowthStage.READY
+
+
+class Cell:
+    def __init__(self, x, y, row, col):
+        self.x = x
+        self.y = y
+        self.row = row
+        self.col = col
+        self.soil = None
+        self.crop = None
+        self.pest = None
+        self.neighbours: tuple["Cell", ...] = ()
+
+    def create_soil(self):
+        self.soil = Soil()
+
+
+# Deslocamentos (linha, coluna) dos vizinhos em cada topologia
+NEIGHBOUR_OFFSETS = {
+    "square4": [(0, 1), (0, -1), (1, 0), (-1, 0)],
+    "square8": [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)],
+}
+
+# Hexágonos em linhas deslocadas: as linhas ímpares ficam meia célula à direita
+HEX_OFFSETS = {
+    0: [(0, 1), (0, -1), (1, -1), (1, 0), (-1, -1), (-1, 0)],
+    1: [(0, 1), (0, -1), (1, 0), (1, 1), (-1, 0), (-1, 1)],
+}
+
+
+class Grid:
+    def __init__(
+        self,
+        num_rows,
+        num_cols,
+        topology=Configs.GRID_TOPOLOGY,
+        wrap=Configs.GRID_WRAP,
+    ):
+        if topology not in NEIGHBOUR_OFFSETS and topology != "hex":
+            raise ValueError(f"Unknown grid topology: {topology}")
+        if topology == "hex" and wrap and num_rows % 2:
+            # Com bordas contínuas, a alternância de linhas precisa fechar o ciclo
+            raise ValueError("Hex grids with wrap need an even number of rows")
+
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.topology = topology
+        self.wrap = wrap
+        self.crops: List[Crop] = []
+
+        start_x = (
+            Configs.SCREEN_WIDTH - (num_cols * Configs.CELL_SIZE)
+        ) // 2 + Configs.CELL_SIZE // 2
+        start_y = (
+            Configs.SCREEN_HEIGHT - (num_rows * Configs.CELL_SIZE)
+        ) // 2 + Configs.CELL_SIZE // 2
+
+        # Canto inferior esquerdo do tabuleiro
+        self.start_x = start_x - Configs.CELL_SIZE // 2
+        self.start_y = start_y - Configs.CELL_SIZE // 2
+
+        self.cells = []
+
+        for row in range(num_rows):
+            self.cells.append([])
+            for col in range(num_cols):
+                x = start_x + col * Configs.CELL_SIZE + self.row_offset(row)
+                y = start_y + row * Configs.CELL_SIZE
+
+                cell = Cell(x, y, row, col)
+                cell.create_soil()
+
+                self.cells[row].append(cell)
+
+        # Tabela de vizinhos calculada uma única vez, em índices row-major
+        self.neighbour_indices = self._build_neighbour_indices()
+        for row in self.cells:
+            for cell in row:
+                cell.neighbours = tuple(
+                    self.get_cell(*divmod(index, num_cols))
+                    for index in self.neighbour_indices[cell.row * num_cols + cell.col]
+                )
+
+        # Manchas de culturas vulneráveis e distâncias até elas, definidas
+        # pelo PlagueManager
+        self.risk_clusters = RiskClusters(self)
+        self.distance_field = DistanceField(self)
+
+    def _build_neighbour_indices(self) -> List[tuple[int, ...]]:
+        table = []
+        for row in range(self.num_rows):
+            if self.topology == "hex":
+                offsets = HEX_OFFSETS[row % 2]
+            else:
+                offsets = NEIGHBOUR_OFFSETS[self.topology]
+
+            for col in range(self.num_cols):
+                neighbours = []
+                for dr, dc in offsets:
+                    new_row, new_col = row + dr, col + dc
+                    if self.wrap:
+                        new_row %= self.num_rows
+                        new_col %= self.num_cols
+                    elif not (
+                        0 <= new_row < self.num_rows and 0 <= new_col < self.num_cols
+                    ):
+                        continue
+
+                    index = new_row * self.num_cols + new_col
+                    # Em tabuleiros pequenos com borda contínua, evitar repetições
+                    if index != row * self.num_cols + col and index not in neighbours:
+                        neighbours.append(index)
+                table.append(tuple(neighbours))
+        return table
+
+    def row_offset(self, row) -> int:
+        if self.topology == "hex" and row % 2:
+            return Configs.CELL_SIZE // 2
+        return 0
+
+    def get_cell(self, row, col):
+        return self.cells[row][col]
+
+    def index_for_position(self, x, y) -> tuple[int, int]:
+        row = int((y - self.start_y) // Configs.CELL_SIZE)
+        col = int((x - self.start_x - self.row_offset(row)) // Configs.CELL_SIZE)
+        return row, col
+
+    def get_cell_for_position(self, x, y) -> Optional[Cell]:
+        row, col = self.index_for_position(x, y)
+        if 0 <= row < self.num_rows and 0 <= col < self.num_cols:
+            return self.cells[row][col]
+        return None
+
+    def add_crop(self, cell, crop):
+        cell.crop = crop
+        self.crops.append(crop)
+        self.risk_clusters.on_crop_added(cell)
+        self.distance_field.on_crop_added(cell)
+
+    def remove_crop(self, cell):
+        self.crops.remove(cell.crop)
+        cell.crop = None
+        self.risk_clusters.on_crops_removed([cell])
+        self.distance_field.on_crops_removed([cell])
+
+    def remove_crops(self, cells):
+        # Remoção em lote: a lista de culturas é reconstruída uma única vez
+        removed = set()
+        for cell in cells:
+            removed.add(cell.crop)
+            cell.crop = None
+        self.crops = [crop for crop in self.crops if crop not in removed]
+        self.risk_clusters.on_crops_removed(cells)
+        self.distance_field.on_crops_removed(cells)
+
+
+class Player:
+
+    def __init__(self):
+        self.selected_action = PlayerAction.PLANT
+        self.money = 250
+        self.selected_crop_type = "carrot"
+
+    def select_crop(self, crop_type: str):
+        if crop_type in CropFactory._crop_configs:
+            self.selected_crop_type = crop_type
+
+    def select_action(self, action: PlayerAction):
+        self.selected_action = action
+
+
+class Plague:
+    DAMAGE_PER_SECOND = 20
+
+    def __init__(
+        self, center_x: float, center_y: float, plague_manager: "PlagueManager"
+    ):
+        # Identificador estável, usado pelo renderizador para interpolar posições
+        self.id = next(plague_manager.plague_ids)
+
+        self.center_x = center_x
+        self.center_y = center_y
+        self.state = PlagueState.CONSUMING
+        self.damage_per_second = self.DAMAGE_PER_SECOND
+        self.target_crop = None
+        self.plague_manager = plague_manager
+        # Tempo em busca e fração do próximo passo já percorrida
+        self.search_time = 0.0
+        self.search_progress = 0.0
+
+    def update(self, delta_time: float):
+        if self.state == PlagueState.SEARCHING:
+            self._search(delta_time)
+        elif self.state == PlagueState.CONSUMING and self.target_crop:
+            # Calcular dano amplificado baseado em pragas adjacentes
+            adjacent_plagues = self.get_adjacent_plagues()
+            multiplier = min(1 + (len(adjacent_plagues) * 0.5), 3.0)
+            damage = self.damage_per_second * delta_time * multiplier
+            self.target_crop.damage(damage)
+
+            # Se a cultura foi totalmente consumida
+            if self.target_crop.hp <= 0:
+                # Incrementar contador de culturas consumidas
+                self.plague_manager.increment_crops_consumed()
+
+                # Remover a cultura da célula atual
+                current_cell = self.plague_manager._get_cell_for_position(
+                    self.center_x, self.center_y
+                )
+                if current_cell:
+                    self.plague_manager.grid.remove_crop(current_cell)
+                    current_cell.soil.kill()
+                    self.plague_manager.telemetry.record(
+                        TelemetryEvent.CROP_CONSUMED,
+                        current_cell.row,
+                        current_cell.col,
+                        self.plague_manager.crops_consumed,
+                    )
+
+                # Procurar nova cultura alvo
+                new_target = self.plague_manager._find_new_target(self)
+                if new_target:
+                    # Mover para nova cultura
+                    self.plague_manager._claim_target(self, new_target)
+                    self.center_x = new_target.center_x
+                    self.center_y = new_target.center_y
+                    row, col = self.plague_manager.grid.index_for_position(
+                        self.center_x, self.center_y
+                    )
+                    self.plague_manager.telemetry.record(
+                        TelemetryEvent.PLAGUE_MOVED, row, col, self.id
+                    )
+                elif Configs.PLAGUE_SEARCH and self._can_reach_target(current_cell):
+                    # Sem vizinho vulnerável: atravessar o campo até o mais próximo
+                    self.target_crop = None
+                    self.state = PlagueState.SEARCHING
+                    self.search_time = 0.0
+                    self.search_progress = 0.0
+                else:
+                    # Se não encontrar alvo, marcar para morrer
+                    self.state = PlagueState.DYING
+
+    def _can_reach_target(self, cell: Optional[Cell]) -> bool:
+        if cell is None:
+            return False
+        grid = self.plague_manager.grid
+        return grid.distance_field.is_reachable(cell.row * grid.num_cols + cell.col)
+
+    def _search(self, delta_time: float):
+        """Anda pelo campo de distâncias até uma cultura vulnerável livre."""
+        self.search_time += delta_time
+        if self.search_time >= Configs.PLAGUE_SEARCH_TIMEOUT:
+            self.state = PlagueState.DYING
+            return
+
+        plague_manager = self.plague_manager
+        grid = plague_manager.grid
+        cell = plague_manager._get_cell_for_position(self.center_x, self.center_y)
+        if cell is None:
+            self.state = PlagueState.DYING
+            return
+
+        self.search_progress += delta_time * Configs.PLAGUE_SEARCH_SPEED
+        while True:
+            if plague_manager._is_free_target(cell, ignore=self):
+                plague_manager._claim_target(self, cell.crop)
+                self.state = PlagueState.CONSUMING
+                return
+
+            if self.search_progress < 1.0:
+                return
+
+            index = cell.row * grid.num_cols + cell.col
+            steps = grid.distance_field.steps_towards_target(index)
+            if not steps:
+                self.state = PlagueState.DYING
+                return
+
+            # Cada célula comporta uma praga: com o caminho ocupado, espera
+            steps = [grid.get_cell(*divmod(step, grid.num_cols)) for step in steps]
+            free_cells = [
+                step for step in steps if not plague_manager._has_plague(step)
+            ]
+            if not free_cells:
+                self.search_progress = 1.0
+                return
+
+            self.search_progress -= 1.0
+            cell = random.choice(free_cells)
+            self.center_x = cell.x
+            self.center_y = cell.y
+            plague_manager.telemetry.record(
+                TelemetryEvent.PLAGUE_MOVED, cell.row, cell.col, self.id
+            )
+
+    def __hash__(self):
+        # Com hash pelo id, a ordem de iteração do conjunto de pragas só
+        # depende da partida, e partidas com a mesma semente se repetem
+        return self.id
+
+    def get_adjacent_plagues(self) -> List["Plague"]:
+        if not self.target_crop:
+            return []
+
+        current_cell = self.plague_manager._get_cell_for_position(
+            self.center_x, self.center_y
+        )
+        if not current_cell:
+            return []
+
+        adjacent_cells = self.plague_manager._get_adjacent_cells(current_cell)
+        adjacent_plagues = []
+
+        for cell in adjacent_cells:
+            for plague in self.plague_manager.plagues:
+                if (
+                    plague is not self
+                    and plague.target_crop
+                    and plague.target_crop is cell.crop
+                ):
+                    adjacent_plagues.append(plague)
+
+        return adjacent_plagues
+
+
+class PlagueManager:
+    def __init__(self, grid, telemetry=None):
+        self.grid = grid
+        self.telemetry = telemetry or NullTelemetry()
+        self.plagues: Set[Plague] = set()
+        self.plague_ids = itertools.count()
+        self.vulnerable_crop_types: Set[str] = set()
+        self.plague_power = 1.0
+        self.spawn_cooldown = 5.0
+        self.time_since_spawn = self.spawn_cooldown
+        self.max_plagues = 2
+        self.crops_consumed = 0
+
+        selected_crop = random.choice(list(CropFactory._crop_configs.keys()))
+        self.set_vulnerable_types({selected_crop})
+        print(f"Vulnerable crop type: {selected_crop}")
+
+    def set_vulnerable_types(self, vulnerable_crop_types):
+        self.vulnerable_crop_types = set(vulnerable_crop_types)
+        self.grid.risk_clusters.set_vulnerable_types(self.vulnerable_crop_types)
+        self.grid.distance_field.set_vulnerable_types(self.vulnerable_crop_types)
+
+    def update(self, delta_time: float):
+        self.time_since_spawn += delta_time
+
+        self.update_max_plagues()
+
+        if (
+            len(self.plagues) < self.max_plagues
+            and self.time_since_spawn >= self.spawn_cooldown
+        ):
+            print(f"Attempting to spawn plague. Current plagues: {len(self.plagues)}")
+            self._try_spawn_plague()
+            self.time_since_spawn = 0.0
+
+        # Atualizar pragas existentes
+        dead_plagues = set()
+        for plague in self.plagues:
+            plague.update(delta_time)
+            if plague.state == PlagueState.DYING:
+                dead_plagues.add(plague)
+
+        # Remover pragas mortas
+        for plague in dead_plagues:
+            self.remove_plague(plague)
+
+    @staticmethod
+    def max_plagues_for(crops_consumed: int) -> int:
+        # Exemplo de fórmula para aumentar max_plagues
+        # Começa com 2 e aumenta 1 a cada 2 plantas consumidas, até um máximo de 10
+        return min(2 + (crops_consumed // 2), 10)
+
+    def update_max_plagues(self):
+        new_max = self.max_plagues_for(self.crops_consumed)
+        if new_max != self.max_plagues:
+            self.max_plagues = new_max
+            print(f"Max plagues increased to {self.max_plagues}")
+            self.telemetry.record(
+                TelemetryEvent.MAX_PLAGUES_CHANGED, value=self.max_plagues
+            )
+
+    def increment_crops_consumed(self):
+        self.crops_consumed += 1
+        print(f"Crops consumed: {self.crops_consumed}")
+
+    def _try_spawn_plague(self):
+        vulnerable_cells = [
+            cell
+            for row in self.grid.cells
+            for cell in row
+            if self._is_free_target(cell)
+        ]
+
+        if vulnerable_cells:
+            target_cell = random.choice(vulnerable_cells)
+            target_crop = target_cell.crop
+            print(
+                f"Spawning plague on crop at ({target_crop.center_x}, {target_crop.center_y})"
+            )
+            new_plague = Plague(target_crop.center_x, target_crop.center_y, self)
+            self._claim_target(new_plague, target_crop)
+            self.plagues.add(new_plague)
+            self.telemetry.record(
+                TelemetryEvent.PLAGUE_SPAWNED,
+                target_cell.row,
+                target_cell.col,
+                new_plague.id,
+            )
+        else:
+            print("No vulnerable crops found for new plague")
+
+    def _find_new_target(self, plague: Plague) -> Optional[Crop]:
+        current_cell = self._get_cell_for_position(plague.center_x, plague.center_y)
+        if not current_cell:
+            return None
+
+        adjacent_cells = self._get_adjacent_cells(current_cell)
+        valid_targets = []
+
+        for cell in adjacent_cells:
+            if self._is_free_target(cell):
+                valid_targets.append(cell.crop)
+
+        return random.choice(valid_targets) if valid_targets else None
+
+    def remove_plague(self, plague: Plague):
+        if plague in self.plagues:
+            self.plagues.remove(plague)
+            self._release_target(plague)
+
+    def remove_plagues(self, plagues: List[Plague]):
+        for plague in plagues:
+            self.remove_plague(plague)
+
+    def _claim_target(self, plague: Plague, crop: Crop):
+        # O campo de distâncias só guia pragas em busca até culturas livres
+        plague.target_crop = crop
+        cell = self._get_cell_for_position(crop.center_x, crop.center_y)
+        self.grid.distance_field.claim(cell)
+
+    def _release_target(self, plague: Plague):
+        crop = plague.target_crop
+        if crop is None or crop.hp <= 0:
+            return
+        cell = self._get_cell_for_position(crop.center_x, crop.center_y)
+        if cell is not None and cell.crop is crop:
+            self.grid.distance_field.release(cell)
+
+    def plagues_by_crop(self) -> Dict[Crop, List[Plague]]:
+        plagues_by_crop = {}
+        for plague in self.plagues:
+            if plague.target_crop:
+                plagues_by_crop.setdefault(plague.target_crop, []).append(plague)
+        return plagues_by_crop
+
+    def plagues_searching_by_cell(self) -> Dict[Cell, List[Plague]]:
+        searching = {}
+        for plague in self.plagues:
+            if plague.state == PlagueState.SEARCHING:
+                cell = self._get_cell_for_position(plague.center_x, plague.center_y)
+                searching.setdefault(cell, []).append(plague)
+        return searching
+
+    def _has_plague(self, cell: Cell, ignore: Optional[Plague] = None) -> bool:
+        # Pragas em busca não têm alvo, mas ocupam a célula onde estão
+        for plague in self.plagues:
+            if plague is ignore:
+                continue
+            if cell.crop is not None and plague.target_crop is cell.crop:
+                return True
+            if self._get_cell_for_position(plague.center_x, plague.center_y) is cell:
+                return True
+        return False
+
+    def _is_free_target(self, cell: Cell, ignore: Optional[Plague] = None) -> bool:
+        return (
+            cell.crop is not None
+            and cell.crop.type in self.vulnerable_crop_types
+            and cell.crop.hp > 0
+            and not self._has_plague(cell, ignore)
+        )
+
+    def _get_cell_for_position(self, x: float, y: float) -> Optional[Cell]:
+        return self.grid.get_cell_for_position(x, y)
+
+    def _get_adjacent_cells(self, cell: Cell) -> tuple[Cell, ...]:
+        return cell.neighbours
+
+    def clear(self):
+        for plague in self.plagues:
+            plague.target_crop = None
+            plague.plague_manager = None
+        self.plagues.clear()
+
+    @property
+    def active_plagues(self) -> int:
+        return len(self.plagues)
@@ -1,17 +1,79 @@
+import arcade
 from arcade import Window
+from arcade.gui import UIWidget
 from .configs import Configs
-from .menu_view import MenuView
+from .scene_manager import SceneManager
+
+
+class GameWindow(Window):
+    """Janela que desmonta explicitamente a tela anterior a cada transição.
+
+    As telas do jogo são mantidas pelo ``SceneManager`` e só são desmontadas
+    quando a janela fecha.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scenes = SceneManager(self)
+        self.diagnostics = None
+
+        if Configs.MEMORY_DIAGNOSTICS:
+            from .diagnostics import MemoryDiagnostics
+            from .game_view import GameView
+            from .sprites import SpriteManager
+            from .simulation import Simulation
+
+            self.diagnostics = MemoryDiagnostics(
+                {
+                    "GameView": GameView,
+                    "SpriteManager": SpriteManager,
+                    "Simulation": Simulation,
+                    "Sprite": arcade.Sprite,
+                    "SpriteList": arcade.SpriteList,
+                    "Texture": arcade.Texture,
+                    "UIWidget": UIWidget,
+                }
+            )
+
+    def show_view(self, new_view):
+        old_view = self.current_view
+        super().show_view(new_view)
+
+        if old_view is not None and old_view is not new_view:
+            # A transição costuma partir de um evento da própria tela antiga,
+            # então a desmontagem fica para o próximo tick
+            arcade.schedule_once(
+                lambda delta_time: self._retire_view(old_view, new_view), 0
+            )
+
+    def close(self):
+        self.scenes.teardown()
+        super().close()
+
+    def _retire_view(self, old_view, new_view):
+        # Telas mantidas pelo SceneManager continuam vivas para reuso
+        teardown = getattr(old_view, "teardown", None)
+        if teardown is not None and not self.scenes.is_cached(old_view):
+            teardown()
+
+        if self.diagnostics is not None:
+            from .game_view import GameView
+
+            self.diagnostics.take_snapshot(
+                f"{type(old_view).__name__} -> {type(new_view).__name__}",
+                restart=isinstance(new_view, GameView),
+            )
 
 
 class MyGame:
 
     def __init__(self):
-        self.window = Window(
+        self.window = GameWindow(
             Configs.SCREEN_WIDTH,
             Configs.SCREEN_HEIGHT,
             Configs.SCREEN_TITLE,
         )
 
     def start(self):
-        self.window.show_view(MenuView())
+        self.window.scenes.show_menu()
         self.window.run()
@@ -0,0 +1,47 @@
+from .game_over_view import GameOverView
+from .game_view import GameView
+from .menu_view import MenuView
+from .story_view import StoryView
+
+
+class SceneManager:
+    """Cria cada tela uma única vez e a reutiliza em todas as transições.
+
+    Widgets, layouts e sprites de uma tela são construídos na primeira vez em
+    que ela é mostrada; reinícios de partida apenas chamam ``GameView.setup``.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._views = {}
+
+    def _get(self, view_class):
+        view = self._views.get(view_class)
+        if view is None:
+            view = view_class()
+            self._views[view_class] = view
+        return view
+
+    def is_cached(self, view) -> bool:
+        return self._views.get(type(view)) is view
+
+    def show_menu(self):
+        self.window.show_view(self._get(MenuView))
+
+    def show_story(self):
+        self.window.show_view(self._get(StoryView))
+
+    def show_game(self):
+        game_view = self._get(GameView)
+        game_view.setup()
+        self.window.show_view(game_view)
+
+    def show_game_over(self, crops_harvested=0, plagues_eliminated=0):
+        game_over_view = self._get(GameOverView)
+        game_over_view.set_stats(crops_harvested, plagues_eliminated)
+        self.window.show_view(game_over_view)
+
+    def teardown(self):
+        for view in self._views.values():
+            view.teardown()
+        self._views.clear()
@@ -0,0 +1,469 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Tuple
+from .configs import Configs
+from .model import (
+    CropFactory,
+    Grid,
+    GrowthStage,
+    PlagueManager,
+    PlagueState,
+    Player,
+    PlayerAction,
+)
+from .telemetry import TelemetryEvent, create_telemetry
+
+# Comandos enviados pela interface para a simulação
+
+
+@dataclass(frozen=True)
+class SelectCropCommand:
+    crop_type: str
+
+
+@dataclass(frozen=True)
+class SelectActionCommand:
+    action: PlayerAction
+
+
+@dataclass(frozen=True)
+class CellCommand:
+    """Aplica a ação selecionada pelo jogador na célula (row, col)."""
+
+    row: int
+    col: int
+
+
+@dataclass(frozen=True)
+class AreaCommand:
+    """Aplica a ação selecionada em todas as células do retângulo (inclusivo)."""
+
+    row_start: int
+    col_start: int
+    row_end: int
+    col_end: int
+
+
+# Estados imutáveis publicados pela simulação para o renderizador
+
+
+class CellSnapshot(NamedTuple):
+    x: float
+    y: float
+    soil_alive: bool
+    crop_type: Optional[str]
+    growth_stage: Optional[GrowthStage]
+    hp: float
+    growth_progress: float
+    risk_cluster_size: int  # 0 se a célula não faz parte de uma mancha vulnerável
+
+
+class PlagueSnapshot(NamedTuple):
+    id: int
+    cell_index: int  # índice row-major da célula onde a praga está
+    x: float
+    y: float
+    state: PlagueState
+    multiplier: float
+    adjacent: Tuple[Tuple[float, float], ...]  # posições das pragas vizinhas
+    damage_per_second: float
+    search_time: float  # segundos em busca (0 se consumindo)
+
+
+class BoardSnapshot(NamedTuple):
+    tick: int
+    time: float
+    created_at: float
+    num_rows: int
+    num_cols: int
+    cells: Tuple[CellSnapshot, ...]  # ordem row-major
+    plagues: Tuple[PlagueSnapshot, ...]
+    money: int
+    active_plagues: int
+    max_plagues: int
+    crops_consumed: int
+    time_since_spawn: float
+    spawn_cooldown: float
+    vulnerable_crop_types: Tuple[str, ...]
+    crops_harvested: int
+    plagues_eliminated: int
+    selected_action: PlayerAction
+    selected_crop_type: str
+    largest_risk_cluster: int
+    game_over: bool
+
+
+class Simulation:
+    """Estado completo de uma partida, sem nenhuma dependência de renderização."""
+
+    def __init__(
+        self,
+        num_rows=Configs.GRID_ROWS,
+        num_cols=Configs.GRID_COLS,
+        telemetry=None,
+        topology=Configs.GRID_TOPOLOGY,
+        wrap=Configs.GRID_WRAP,
+    ):
+        self.telemetry = telemetry or create_telemetry(Configs.TELEMETRY_DIR)
+        self.grid = Grid(num_rows, num_cols, topology, wrap)
+        self.player = Player()
+        self.plague_manager = PlagueManager(self.grid, self.telemetry)
+        self.total_time = 0
+        self.tick = 0
+        self.crops_harvested = 0
+        self.plagues_eliminated = 0
+        self.game_over = False
+
+    def step(self, delta_time: float):
+        if self.game_over:
+            return
+
+        self.total_time += delta_time
+        self.tick += 1
+        self.telemetry.advance(self.tick, self.total_time)
+
+        self.plague_manager.update(delta_time)
+
+        for crop in self.grid.crops:
+            crop.update(self.total_time)
+
+        # Verificar condição de game over
+        if self.is_game_over():
+            self.game_over = True
+
+    def close(self):
+        # Grava os eventos ainda em buffer
+        self.telemetry.close()
+        # Quebra as referências cruzadas entre pragas e o gerenciador
+        self.plague_manager.clear()
+
+    def apply(self, command):
+        if self.game_over:
+            return
+
+        if isinstance(command, SelectCropCommand):
+            self.player.select_crop(command.crop_type)
+        elif isinstance(command, SelectActionCommand):
+            self.player.select_action(command.action)
+        elif isinstance(command, CellCommand):
+            self._apply_area_action(command.row, command.col, command.row, command.col)
+        elif isinstance(command, AreaCommand):
+            self._apply_area_action(
+                command.row_start, command.col_start, command.row_end, command.col_end
+            )
+        else:
+            raise ValueError(f"Unknown command: {command!r}")
+
+    def _apply_area_action(self, row_start, col_start, row_end, col_end):
+        """Aplica a ação selecionada em todas as células da região, em lote.
+
+        Verificações de custo, busca de pragas e de game over são feitas uma
+        única vez por lote, e não uma vez por célula.
+        """
+        row_start, row_end = sorted((row_start, row_end))
+        col_start, col_end = sorted((col_start, col_end))
+        row_start, col_start = max(row_start, 0), max(col_start, 0)
+        row_end = min(row_end, self.grid.num_rows - 1)
+        col_end = min(col_end, self.grid.num_cols - 1)
+
+        cells = [
+            self.grid.get_cell(row, col)
+            for row in range(row_start, row_end + 1)
+            for col in range(col_start, col_end + 1)
+            if self.grid.get_cell(row, col).soil.is_alive
+        ]
+        if not cells:
+            return
+
+        if self.player.selected_action == PlayerAction.PLANT:
+            crop_type = self.player.selected_crop_type
+            crop_config = CropFactory._crop_configs[crop_type]
+            empty_cells = [cell for cell in cells if cell.crop is None]
+
+            # Planta até onde o dinheiro permitir, na ordem das células
+            affordable = min(len(empty_cells), self.player.money // crop_config.value)
+            if affordable == 0:
+                return
+
+            crop_index = list(CropFactory._crop_configs).index(crop_type)
+            for cell in empty_cells[:affordable]:
+                new_crop = CropFactory.create_crop(
+                    crop_type, cell.x, cell.y, self.total_time
+                )
+                self.grid.add_crop(cell, new_crop)
+                self.telemetry.record(
+                    TelemetryEvent.CROP_PLANTED, cell.row, cell.col, crop_index
+                )
+            self.player.money -= crop_config.value * affordable
+
+            # Verificar game over após gastar dinheiro
+            if self.is_game_over():
+                self.game_over = True
+
+        elif self.player.selected_action == PlayerAction.HARVEST:
+            plagues_by_crop = self.plague_manager.plagues_by_crop()
+            harvestable = [
+                cell
+                for cell in cells
+                if cell.crop
+                and cell.crop.is_harvestable
+                and cell.crop not in plagues_by_crop
+            ]
+            if not harvestable:
+                return
+
+            for cell in harvestable:
+                self.player.money += cell.crop.value
+                self.telemetry.record(
+                    TelemetryEvent.CROP_HARVESTED, cell.row, cell.col, cell.crop.value
+                )
+            self.grid.remove_crops(harvestable)
+            self.crops_harvested += len(harvestable)
+
+        elif self.player.selected_action == PlayerAction.APPLY_PESTICIDE:
+            cost = 30  # Custo do pesticida, por célula tratada
+            plagues_by_crop = self.plague_manager.plagues_by_crop()
+            # Pragas em busca também são atingidas na célula onde estão
+            searching = self.plague_manager.plagues_searching_by_cell()
+            infested = [
+                cell
+                for cell in cells
+                if cell.crop in plagues_by_crop or cell in searching
+            ]
+
+            treated = infested[: self.player.money // cost]
+            if not treated:
+                return
+
+            self.player.money -= cost * len(treated)
+            plagues_to_remove = []
+            for cell in treated:
+                plagues = plagues_by_crop.get(cell.crop, []) + searching.get(cell, [])
+                plagues_to_remove.extend(plagues)
+                self.telemetry.record(
+                    TelemetryEvent.PESTICIDE_APPLIED, cell.row, cell.col, len(plagues)
+                )
+            self.plague_manager.remove_plagues(plagues_to_remove)
+            self.plagues_eliminated += len(plagues_to_remove)
+
+    def risk_clusters(self) -> List[List[tuple[int, int]]]:
+        """Manchas conexas de culturas vulneráveis, como listas de (row, col)."""
+        return self.grid.risk_clusters.clusters()
+
+    def is_game_over(self) -> bool:
+        # Verifica se há dinheiro suficiente para plantar a cultura mais barata
+        cheapest_crop_cost = min(
+            config.value for config in CropFactory._crop_configs.values()
+        )
+        has_money_to_plant = self.player.money >= cheapest_crop_cost
+
+        # Verifica se há culturas que podem ser colhidas
+        has_harvestable_crops = any(crop.is_harvestable for crop in self.grid.crops)
+
+        # Verifica se há culturas crescendo
+        has_growing_crops = any(not crop.is_harvestable for crop in self.grid.crops)
+
+        # Verifica se há células vivas disponíveis para plantar
+        has_available_cells = any(
+            cell.soil.is_alive and cell.crop is None
+            for row in self.grid.cells
+            for cell in row
+        )
+
+        # Game over se:
+        # 1. Não há dinheiro suficiente para plantar E
+        # 2. Não há culturas para colher E
+        # 3. Não há culturas crescendo
+        # OU
+        # 4. Não há células disponíveis para plantar E não há culturas no campo
+        return (
+            not has_money_to_plant
+            and not has_harvestable_crops
+            and not has_growing_crops
+        ) or (
+            not has_available_cells
+            and not has_harvestable_crops
+            and not has_growing_crops
+        )
+
+    def snapshot(self) -> BoardSnapshot:
+        risk_clusters = self.grid.risk_clusters
+        cells = []
+        for row in self.grid.cells:
+            for cell in row:
+                crop = cell.crop
+                cells.append(
+                    CellSnapshot(
+                        x=cell.x,
+                        y=cell.y,
+                        soil_alive=cell.soil.is_alive,
+                        crop_type=crop.type if crop else None,
+                        growth_stage=crop.growth_stage if crop else None,
+                        hp=crop.hp if crop else 0,
+                        growth_progress=(
+                            crop.growth_progress(self.total_time) if crop else 0.0
+                        ),
+                        risk_cluster_size=risk_clusters.cluster_size(
+                            cell.row, cell.col
+                        ),
+                    )
+                )
+
+        plagues = []
+        for plague in self.plague_manager.plagues:
+            row, col = self.grid.index_for_position(plague.center_x, plague.center_y)
+            adjacent_plagues = plague.get_adjacent_plagues()
+            plagues.append(
+                PlagueSnapshot(
+                    id=plague.id,
+                    cell_index=row * self.grid.num_cols + col,
+                    x=plague.center_x,
+                    y=plague.center_y,
+                    state=plague.state,
+                    multiplier=min(1 + (len(adjacent_plagues) * 0.5), 3.0),
+                    adjacent=tuple(
+                        (other.center_x, other.center_y) for other in adjacent_plagues
+                    ),
+                    damage_per_second=plague.damage_per_second,
+                    search_time=plague.search_time,
+                )
+            )
+
+        return BoardSnapshot(
+            tick=self.tick,
+            time=self.total_time,
+            created_at=time.perf_counter(),
+            num_rows=self.grid.num_rows,
+            num_cols=self.grid.num_cols,
+            cells=tuple(cells),
+            plagues=tuple(plagues),
+            money=self.player.money,
+            active_plagues=self.plague_manager.active_plagues,
+            max_plagues=self.plague_manager.max_plagues,
+            crops_consumed=self.plague_manager.crops_consumed,
+            time_since_spawn=self.plague_manager.time_since_spawn,
+            spawn_cooldown=self.plague_manager.spawn_cooldown,
+            vulnerable_crop_types=tuple(self.plague_manager.vulnerable_crop_types),
+            crops_harvested=self.crops_harvested,
+            plagues_eliminated=self.plagues_eliminated,
+            selected_action=self.player.selected_action,
+            selected_crop_type=self.player.selected_crop_type,
+            largest_risk_cluster=risk_clusters.largest_cluster_size,
+            game_over=self.game_over,
+        )
+
+
+# Velocidades de jogo disponíveis (multiplicadores do tempo real)
+GAME_SPEEDS = (1, 2, 8, 64)
+
+
+class SimulationClock:
+    """Converte tempo real em passos de tamanho fixo da simulação.
+
+    O tempo acumulado é multiplicado pela velocidade de jogo e consumido em
+    passos de ``step`` segundos, de modo que o resultado de uma partida não
+    depende da velocidade nem da taxa de quadros. Se os passos de um quadro
+    estouram o ``budget``, o restante fica para o próximo quadro e
+    ``keeping_up`` passa a ser falso.
+    """
+
+    def __init__(
+        self,
+        step=1.0 / Configs.SIMULATION_RATE,
+        budget=Configs.SIMULATION_BUDGET,
+    ):
+        self.step = step
+        self.budget = budget
+        self.speed_index = 0
+        self.accumulator = 0.0
+        self.keeping_up = True
+
+    @property
+    def speed(self) -> int:
+        return GAME_SPEEDS[self.speed_index]
+
+    def cycle_speed(self):
+        self.speed_index = (self.speed_index + 1) % len(GAME_SPEEDS)
+
+    @property
+    def alpha(self) -> float:
+        """Fração do próximo passo já acumulada, usada na interpolação."""
+        return min(self.accumulator / self.step, 1.0)
+
+    def advance(self, simulation: Simulation, delta_time: float) -> int:
+        # Limita o atraso acumulado (por exemplo, após a janela travar)
+        max_backlog = self.speed * Configs.MAX_FRAME_TIME
+        self.accumulator = min(self.accumulator + delta_time * self.speed, max_backlog)
+
+        deadline = time.perf_counter() + self.budget
+        steps = 0
+        while self.accumulator >= self.step and not simulation.game_over:
+            simulation.step(self.step)
+            self.accumulator -= self.step
+            steps += 1
+            if time.perf_counter() >= deadline:
+                break
+
+        self.keeping_up = self.accumulator < self.step or simulation.game_over
+        return steps
+
+
+class SimulationThread(threading.Thread):
+    """Executa a simulação em taxa fixa, independente da taxa de quadros.
+
+    A thread é a única dona do estado da simulação. A interface envia comandos
+    pela fila ``commands`` e lê o par ``snapshots`` (anterior, atual), que é
+    substituído atomicamente a cada tick, sem travar a simulação.
+    """
+
+    def __init__(self, simulation: Simulation, rate=Configs.SIMULATION_RATE):
+        super().__init__(name="simulation", daemon=True)
+        self.simulation = simulation
+        self.step_interval = 1.0 / rate
+        # Cada tick pode executar vários passos quando o jogo está acelerado
+        self.clock = SimulationClock(self.step_interval, budget=self.step_interval)
+        self.commands = queue.SimpleQueue()
+
+        snapshot = simulation.snapshot()
+        self.snapshots = (snapshot, snapshot)
+
+        self._stop_event = threading.Event()
+
+    def submit(self, command):
+        self.commands.put(command)
+
+    def run(self):
+        next_tick = time.perf_counter()
+        while not self._stop_event.is_set():
+            self._drain_commands()
+            if self.clock.advance(self.simulation, self.step_interval):
+                self._publish(self.simulation.snapshot())
+
+            if self.simulation.game_over:
+                break
+
+            next_tick += self.step_interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                # Simulação atrasada: não acumular ticks pendentes
+                next_tick = time.perf_counter()
+
+    def stop(self):
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+    def _drain_commands(self):
+        while True:
+            try:
+                command = self.commands.get_nowait()
+            except queue.Empty:
+                return
+            self.simulation.apply(command)
+
+    def _publish(self, snapshot: BoardSnapshot):
+        self.snapshots = (self.snapshots[1], snapshot)
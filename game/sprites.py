@@ -0,0 +1,200 @@
+import arcade
+from .model import CropFactory, GrowthStage
+
+
+def lerp(start, end, alpha):
+    return start + (end - start) * alpha
+
+
+class SoilSprite(arcade.Sprite):
+    ALIVE = 0
+    DEAD = 1
+
+    _textures = None
+
+    def __init__(self, center_x, center_y):
+        super().__init__(center_x=center_x, center_y=center_y)
+
+        if self._textures is None:
+            raise RuntimeError(
+                "Soil class must be initialized before creating instances."
+            )
+
+        for texture in self._textures:
+            self.append_texture(texture)
+
+        self.set_texture(self.ALIVE)
+
+    def set_alive(self):
+        self.set_texture(self.ALIVE)
+
+    def set_dead(self):
+        self.set_texture(self.DEAD)
+
+    @property
+    def is_alive(self):
+        return self.texture == self.textures[self.ALIVE]
+
+
+class CropSprite(arcade.Sprite):
+    """Espaço fixo da cultura de uma célula.
+
+    O sprite contém as texturas de todos os tipos de cultura; plantar, crescer
+    e colher apenas trocam a textura e a visibilidade.
+    """
+
+    _textures = None  # tipo de cultura -> texturas por estágio de crescimento
+
+    def __init__(self, center_x: float, center_y: float):
+        super().__init__(center_x=center_x, center_y=center_y)
+
+        if self._textures is None:
+            raise RuntimeError(
+                "CropSprite class must be initialized before creating instances."
+            )
+
+        self.texture_offsets = {}
+        for crop_type, textures in self._textures.items():
+            self.texture_offsets[crop_type] = len(self.textures)
+            for texture in textures:
+                self.append_texture(texture)
+
+        self.type = None
+        self.growth_stage = None
+        self.set_texture(0)
+        self.visible = False
+
+    def show(self, crop_type: str, growth_stage: GrowthStage):
+        if crop_type != self.type or growth_stage != self.growth_stage:
+            self.type = crop_type
+            self.growth_stage = growth_stage
+            self.set_texture(self.texture_offsets[crop_type] + growth_stage.value)
+        self.visible = True
+
+    def hide(self):
+        self.type = None
+        self.growth_stage = None
+        self.visible = False
+
+
+class PlagueSprite(arcade.Sprite):
+    """Espaço fixo da praga de uma célula.
+
+    O modelo nunca põe duas pragas na mesma célula: pragas em busca esperam
+    quando o próximo passo está ocupado, e nenhuma praga surge ou salta para
+    a célula de outra.
+    """
+
+    def __init__(self, center_x: float, center_y: float):
+        super().__init__("assets/pest.png", center_x=center_x, center_y=center_y)
+        self.home_x = center_x
+        self.home_y = center_y
+        self.visible = False
+
+
+class SpriteManager:
+    def __init__(self):
+        self.soil_list = arcade.SpriteList()
+        self.crop_list = arcade.SpriteList()
+        self.pest_list = arcade.SpriteList()
+
+        # Um sprite de cada tipo por célula, em ordem row-major, criados uma
+        # única vez: o jogo nunca adiciona nem remove sprites das listas
+        self.soils = []
+        self.crops = []
+        self.pests = []
+        self.visible_pests = set()  # índices das células com praga visível
+
+        self.load_textures()
+
+    def load_textures(self):
+        # As texturas são compartilhadas entre partidas: carregar só uma vez
+        if SoilSprite._textures is None:
+            SoilSprite._textures = [
+                arcade.load_texture("assets/terrain_alive.png"),
+                arcade.load_texture("assets/terrain_dead.png"),
+            ]
+        if CropSprite._textures is None:
+            CropSprite._textures = {
+                crop_type: [arcade.load_texture(path) for path in config.texture_paths]
+                for crop_type, config in CropFactory._crop_configs.items()
+            }
+
+    def build(self, snapshot):
+        """Aloca os espaços de todas as células do tabuleiro."""
+        capacity = len(snapshot.cells)
+        self.soil_list = arcade.SpriteList(capacity=capacity)
+        self.crop_list = arcade.SpriteList(capacity=capacity)
+        self.pest_list = arcade.SpriteList(capacity=capacity)
+        self.soils = []
+        self.crops = []
+        self.pests = []
+        self.visible_pests = set()
+
+        for cell in snapshot.cells:
+            soil = SoilSprite(cell.x, cell.y)
+            crop = CropSprite(cell.x, cell.y)
+            pest = PlagueSprite(cell.x, cell.y)
+            self.soils.append(soil)
+            self.crops.append(crop)
+            self.pests.append(pest)
+            self.soil_list.append(soil)
+            self.crop_list.append(crop)
+            self.pest_list.append(pest)
+
+    def sync(self, snapshot, previous, alpha=1.0, update_crops=True):
+        """Atualiza os sprites para refletir o estado publicado pela simulação.
+
+        Posições das pragas são interpoladas entre ``previous`` e ``snapshot``.
+        Com ``update_crops`` falso, as culturas mantêm a textura atual.
+        """
+        if len(self.soils) != len(snapshot.cells):
+            self.build(snapshot)
+            update_crops = True
+
+        for index, cell in enumerate(snapshot.cells):
+            soil = self.soils[index]
+            if cell.soil_alive != soil.is_alive:
+                soil.set_alive() if cell.soil_alive else soil.set_dead()
+
+            if not update_crops:
+                continue
+            crop = self.crops[index]
+            if cell.crop_type is not None:
+                crop.show(cell.crop_type, cell.growth_stage)
+            elif crop.visible:
+                crop.hide()
+
+        previous_plagues = {plague.id: plague for plague in previous.plagues}
+        visible_pests = set()
+        for plague in snapshot.plagues:
+            pest = self.pests[plague.cell_index]
+            visible_pests.add(plague.cell_index)
+
+            # A praga é desenhada no espaço da célula de destino, deslizando
+            # a partir da posição anterior
+            x, y = pest.home_x, pest.home_y
+            before = previous_plagues.get(plague.id)
+            if before is not None:
+                x = lerp(before.x, plague.x, alpha)
+                y = lerp(before.y, plague.y, alpha)
+            pest.center_x = x
+            pest.center_y = y
+            pest.visible = True
+
+        for index in self.visible_pests - visible_pests:
+            self.pests[index].visible = False
+        self.visible_pests = visible_pests
+
+    def draw(self):
+        self.soil_list.draw()
+        self.crop_list.draw()
+        self.pest_list.draw()
+
+    def clear(self):
+        for sprite_list in (self.soil_list, self.crop_list, self.pest_list):
+            sprite_list.clear()
+        self.soils = []
+        self.crops = []
+        self.pests = []
+        self.visible_pests = set()
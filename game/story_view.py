@@ -49,14 +49,12 @@ class StoryView(UIView):
 
         @play_button.event("on_click")
         def _(event):
-            from .game_view import GameView
-
-            game_view = GameView()
-            game_view.setup()
-            self.window.show_view(game_view)
+            self.window.scenes.show_game()
 
         @back_button.event("on_click")
         def _(event):
-            from .menu_view import MenuView
+            self.window.scenes.show_menu()
 
-            self.window.show_view(MenuView())
+    def teardown(self):
+        # Remove os widgets e, com eles, os handlers que referenciam a tela
+        self.ui.clear()
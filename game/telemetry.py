@@ -0,0 +1,191 @@
+import itertools
+import json
+import mmap
+import os
+import sys
+import time
+from array import array
+from enum import IntEnum
+from .configs import Configs
+
+
+class TelemetryEvent(IntEnum):
+    """Tipos de evento registrados. O significado da coluna ``value`` varia:
+
+    - CROP_PLANTED: índice do tipo de cultura em ``CropFactory._crop_configs``
+    - PLAGUE_SPAWNED / PLAGUE_MOVED: id da praga
+    - CROP_CONSUMED: total de culturas consumidas
+    - MAX_PLAGUES_CHANGED: novo limite de pragas
+    - CROP_HARVESTED: dinheiro recebido
+    - PESTICIDE_APPLIED: quantidade de pragas eliminadas na célula
+    """
+
+    CROP_PLANTED = 0
+    PLAGUE_SPAWNED = 1
+    PLAGUE_MOVED = 2
+    CROP_CONSUMED = 3
+    MAX_PLAGUES_CHANGED = 4
+    CROP_HARVESTED = 5
+    PESTICIDE_APPLIED = 6
+
+
+# Nome da coluna -> typecode do módulo array (e dtype equivalente do numpy)
+COLUMNS = {
+    "tick": ("q", "i8"),
+    "time": ("d", "f8"),
+    "event": ("B", "u1"),
+    "row": ("i", "i4"),
+    "col": ("i", "i4"),
+    "value": ("d", "f8"),
+}
+
+
+class NullTelemetry:
+    """Gravador que descarta tudo; usado quando a telemetria está desligada."""
+
+    def advance(self, tick, sim_time):
+        pass
+
+    def record(self, event, row=-1, col=-1, value=0.0):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TelemetryRecorder:
+    """Registra eventos em buffers colunares pré-alocados.
+
+    Quando os buffers enchem, cada coluna é anexada em bloco ao seu próprio
+    arquivo binário em ``directory`` (``tick.bin``, ``time.bin``, ...). O
+    arquivo ``schema.json`` descreve o tipo de cada coluna, de forma que os
+    dados possam ser lidos com ``load_telemetry`` ou com ``numpy.memmap``.
+    """
+
+    def __init__(self, directory, buffer_size=Configs.TELEMETRY_BUFFER_SIZE):
+        self.directory = directory
+        self.buffer_size = buffer_size
+        self.tick = 0
+        self.time = 0.0
+        self.length = 0
+
+        self.buffers = {
+            name: array(typecode, bytes(array(typecode).itemsize * buffer_size))
+            for name, (typecode, _) in COLUMNS.items()
+        }
+
+        os.makedirs(directory, exist_ok=True)
+        self._write_schema()
+        self.files = {
+            name: open(os.path.join(directory, f"{name}.bin"), "ab") for name in COLUMNS
+        }
+
+    def _write_schema(self):
+        byteorder = "<" if sys.byteorder == "little" else ">"
+        schema = {
+            name: {"typecode": typecode, "dtype": byteorder + dtype}
+            for name, (typecode, dtype) in COLUMNS.items()
+        }
+        with open(os.path.join(self.directory, "schema.json"), "w") as schema_file:
+            json.dump(schema, schema_file, indent=2)
+
+    def advance(self, tick, sim_time):
+        self.tick = tick
+        self.time = sim_time
+
+    def record(self, event, row=-1, col=-1, value=0.0):
+        index = self.length
+        buffers = self.buffers
+        buffers["tick"][index] = self.tick
+        buffers["time"][index] = self.time
+        buffers["event"][index] = event
+        buffers["row"][index] = row
+        buffers["col"][index] = col
+        buffers["value"][index] = value
+
+        self.length += 1
+        if self.length == self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.length == 0:
+            return
+
+        for name, buffer in self.buffers.items():
+            self.files[name].write(memoryview(buffer)[: self.length])
+            self.files[name].flush()
+        self.length = 0
+
+    def close(self):
+        if self.files is None:
+            return
+
+        self.flush()
+        for telemetry_file in self.files.values():
+            telemetry_file.close()
+        self.files = None
+
+
+_session_counter = itertools.count()
+
+
+def create_telemetry(directory):
+    if directory is None:
+        return NullTelemetry()
+
+    # Cada partida grava em uma subpasta própria
+    session = "session-{}-{}-{}".format(
+        time.strftime("%Y%m%d-%H%M%S"), os.getpid(), next(_session_counter)
+    )
+    return TelemetryRecorder(os.path.join(directory, session))
+
+
+class TelemetryLog:
+    """Colunas de um registro de telemetria mapeadas em memória, sem cópia."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._mmaps = []
+        self.columns = {}
+
+        with open(os.path.join(directory, "schema.json")) as schema_file:
+            schema = json.load(schema_file)
+
+        for name, column in schema.items():
+            self.columns[name] = self._map_column(name, column["typecode"])
+
+    def _map_column(self, name, typecode):
+        path = os.path.join(self.directory, f"{name}.bin")
+        with open(path, "rb") as column_file:
+            size = os.fstat(column_file.fileno()).st_size
+            if size == 0:
+                return memoryview(array(typecode))
+            mapped = mmap.mmap(column_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._mmaps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def __len__(self):
+        return len(self.columns["tick"])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def indices_of(self, event: TelemetryEvent):
+        events = self.columns["event"]
+        return [index for index in range(len(events)) if events[index] == event]
+
+    def close(self):
+        for name in list(self.columns):
+            self.columns[name].release()
+        self.columns.clear()
+        for mapped in self._mmaps:
+            mapped.close()
+        self._mmaps.clear()
+
+
+def load_telemetry(directory) -> TelemetryLog:
+    return TelemetryLog(directory)
@@ -0,0 +1,84 @@
+"""Procura layouts de plantio que limitam o espalhamento das pragas.
+
+Exemplo (a partir da raiz do repositório)::
+
+    python optimize_layout.py --rows 5 --cols 5 --vulnerable carrot --samples 16
+"""
+
+import argparse
+import sys
+import time
+from game.configs import Configs
+from game.layout_optimizer import (
+    CROP_TYPES,
+    EvaluationSettings,
+    LayoutOptimizer,
+    format_layout,
+)
+from game.model import NEIGHBOUR_OFFSETS, Player
+
+TOPOLOGIES = (*NEIGHBOUR_OFFSETS, "hex")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=Configs.GRID_ROWS)
+    parser.add_argument("--cols", type=int, default=Configs.GRID_COLS)
+    parser.add_argument("--budget", type=int, default=Player().money)
+    parser.add_argument("--vulnerable", choices=CROP_TYPES, default=CROP_TYPES[0])
+    parser.add_argument(
+        "--horizon", type=float, default=60.0, help="segundos simulados por partida"
+    )
+    parser.add_argument("--step", type=float, default=1.0 / Configs.SIMULATION_RATE)
+    parser.add_argument("--topology", choices=TOPOLOGIES, default=Configs.GRID_TOPOLOGY)
+    parser.add_argument("--samples", type=int, default=8, help="partidas por layout")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--patience", type=int, default=10)
+    parser.add_argument("--beam", type=int, default=4)
+    parser.add_argument("--neighbours", type=int, default=16)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="processos (padrão: todos os núcleos)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    settings = EvaluationSettings(
+        num_rows=args.rows,
+        num_cols=args.cols,
+        budget=args.budget,
+        vulnerable_crop_type=args.vulnerable,
+        horizon=args.horizon,
+        step=args.step,
+        topology=args.topology,
+    )
+
+    start = time.perf_counter()
+    with LayoutOptimizer(
+        settings,
+        samples=args.samples,
+        seed=args.seed,
+        workers=args.workers,
+        beam_width=args.beam,
+        neighbours_per_layout=args.neighbours,
+    ) as optimizer:
+        best, score = optimizer.search(args.rounds, args.patience)
+    elapsed = time.perf_counter() - start
+
+    print(format_layout(best, args.cols))
+    planted = sum(1 for crop in best.cells if crop)
+    print(
+        f"Expected crops harvested or standing after {args.horizon:.0f}s: "
+        f"{score:.1f} of {planted} planted"
+    )
+    print(
+        f"{optimizer.evaluations} layouts simulated, "
+        f"{optimizer.table_hits} transposition hits, {elapsed:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())